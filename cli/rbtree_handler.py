@@ -1,14 +1,49 @@
 """
 Handler for Red-Black Tree operations
 """
+import csv
+import functools
+import json
 import os
+import sys
+from datetime import datetime
 from cli.handler_base import MenuHandler
 from storage.red_black_tree import FileIndexManager
 
+# Bound once at import time; these are called per row when listing/exporting
+_fromtimestamp = datetime.fromtimestamp
+_now = datetime.now
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(seconds):
+    """Format whole-second Unix timestamps; files copied together share one entry"""
+    return _fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_DIVISORS = (1, 1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+
+def _csv_rows(files):
+    """Yield one CSV export row per indexed file, reading each metadata field once"""
+    for file in files:
+        metadata = file['metadata']
+        compressed = metadata.get('compression_status', False)
+        yield (
+            file['filename'],
+            metadata.get('path', ''),
+            metadata.get('size', 0),
+            "Yes" if compressed else "No"
+        )
+
 class RBTreeHandler(MenuHandler):
     """
     Handler for Red-Black Tree file indexing operations
     """
+    # Table headers shared by the listing, search and export views
+    _HEADER_FULL = f"{'Filename':<30} {'Path':<40} {'Size':<10} {'Compressed'}"
+    _HEADER_SHORT = f"{'Filename':<30} {'Size':<10} {'Compressed'}"
+    _SEP_90 = "-" * 90
+    _SEP_50 = "-" * 50
+    
     def __init__(self):
         """Initialize the Red-Black Tree handler"""
         super().__init__()
@@ -32,7 +67,9 @@ class RBTreeHandler(MenuHandler):
         
         # Get file information
         file_path = input("Enter the path to the file: ")
-        if not self._validate_file_exists(file_path):
+        file_stat = self._safe_stat(file_path)
+        if file_stat is None:
+            self._display_error_message(f"Error: File {file_path} does not exist.")
             return
         
         filename = input("Enter a name for this file in the index (leave blank to use filename): ").strip()
@@ -40,7 +77,7 @@ class RBTreeHandler(MenuHandler):
             filename = os.path.basename(file_path)
         
         # Get file attributes
-        file_size = os.path.getsize(file_path)
+        file_size = file_stat.st_size
         compressed = input("Is this file compressed? (y/n): ").lower() == 'y'
         
         # Add file to index
@@ -78,8 +115,8 @@ class RBTreeHandler(MenuHandler):
             if file_result:
                 # Found an exact match
                 print(f"\nFound file matching '{search_term}':")
-                print(f"{'Filename':<30} {'Path':<40} {'Size':<10} {'Compressed'}")
-                print("-" * 90)
+                print(self._HEADER_FULL)
+                print(self._SEP_90)
                 
                 compressed_status = "Yes" if file_result.get('compression_status', False) else "No"
                 size_display = self._format_file_size(file_result.get('size', 0))
@@ -98,28 +135,30 @@ class RBTreeHandler(MenuHandler):
                     
                 result_count = len(partial_results)
                 print(f"\nFound {result_count} file(s) partially matching '{search_term}':")
-                print(f"{'Filename':<30} {'Path':<40} {'Size':<10} {'Compressed'}")
-                print("-" * 90)
+                print(self._HEADER_FULL)
+                print(self._SEP_90)
                 
+                # Collect the rows and write them in one go rather than one print per file
+                lines = []
                 for result in partial_results:
                     metadata = result['metadata']
                     compressed_status = "Yes" if metadata.get('compression_status', False) else "No"
                     size_display = self._format_file_size(metadata.get('size', 0))
-                    print(f"{result['filename']:<30} {metadata.get('path', ''):<40} {size_display:<10} {compressed_status}")
+                    lines.append(f"{result['filename']:<30} {metadata.get('path', ''):<40} {size_display:<10} {compressed_status}")
+                sys.stdout.write("\n".join(lines) + "\n")
                 
                 # Ask if user wants detailed information about a specific result
                 if result_count > 1:
+                    results_by_name = {result['filename']: result for result in partial_results}
                     detail_file = input("\nEnter the exact filename to show detailed information (or leave blank): ").strip()
-                    if detail_file:
-                        for result in partial_results:
-                            if result['filename'] == detail_file:
-                                self._display_file_details({
-                                    'filename': result['filename'],
-                                    'filepath': result['metadata'].get('path', ''),
-                                    'size': result['metadata'].get('size', 0),
-                                    'compression_status': result['metadata'].get('compression_status', False)
-                                })
-                                break
+                    result = results_by_name.get(detail_file) if detail_file else None
+                    if result:
+                        self._display_file_details({
+                            'filename': result['filename'],
+                            'filepath': result['metadata'].get('path', ''),
+                            'size': result['metadata'].get('size', 0),
+                            'compression_status': result['metadata'].get('compression_status', False)
+                        })
                 
         except Exception as e:
             self._display_error_message(f"Error searching for file: {str(e)}")
@@ -168,14 +207,16 @@ class RBTreeHandler(MenuHandler):
             
             # Print the header for the file table
             print(f"\nTotal files: {file_count}")
-            print(f"\n{'Filename':<30} {'Size':<10} {'Compressed'}")
-            print("-" * 50)
+            print(f"\n{self._HEADER_SHORT}")
+            print(self._SEP_50)
             
             # Calculate total size
             total_size = 0
             compressed_files = 0
             
-            # Print each file
+            # Format each file, then write the whole table at once
+            lines = []
+            format_size = self._format_file_size
             for file_info in all_files:
                 filename = file_info['filename']
                 metadata = file_info['metadata']
@@ -183,12 +224,13 @@ class RBTreeHandler(MenuHandler):
                 file_size = metadata.get('size', 0)
                 total_size += file_size
                 
-                compressed_status = "Yes" if metadata.get('compression_status', False) else "No"
-                if metadata.get('compression_status', False):
+                compressed = metadata.get('compression_status', False)
+                compressed_status = "Yes" if compressed else "No"
+                if compressed:
                     compressed_files += 1
                     
-                size_display = self._format_file_size(file_size)
-                print(f"{filename:<30} {size_display:<10} {compressed_status}")
+                lines.append(f"{filename:<30} {format_size(file_size):<10} {compressed_status}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
             # Print summary
             print(f"\nTotal size: {self._format_file_size(total_size)}")
@@ -217,13 +259,13 @@ class RBTreeHandler(MenuHandler):
         
         # Check if file exists
         if filepath:
-            file_exists = os.path.exists(filepath)
+            # A single stat answers both existence and modification time
+            file_stat = self._safe_stat(filepath)
+            file_exists = file_stat is not None
             print(f"File exists on disk: {'Yes' if file_exists else 'No'}")
             
             if file_exists:
-                # Get file modification time
-                mod_time = os.path.getmtime(filepath)
-                print(f"Last modified: {self._format_datetime(mod_time)}")
+                print(f"Last modified: {self._format_datetime(file_stat.st_mtime)}")
         else:
             print("File exists on disk: No (no path information)")
     
@@ -242,9 +284,11 @@ class RBTreeHandler(MenuHandler):
             out.write(f"Total files: {len(files)}\n")
             out.write(f"Date exported: {self._get_current_datetime()}\n\n")
             
-            out.write(f"{'Filename':<30} {'Path':<40} {'Size':<10} {'Compressed'}\n")
-            out.write("-" * 90 + "\n")
+            out.write(self._HEADER_FULL + "\n")
+            out.write(self._SEP_90 + "\n")
             
+            lines = []
+            format_size = self._format_file_size
             for file in files:
                 filename = file['filename']
                 metadata = file['metadata']
@@ -253,8 +297,8 @@ class RBTreeHandler(MenuHandler):
                 compressed = metadata.get('compression_status', False)
                 
                 compressed_status = "Yes" if compressed else "No"
-                size_display = self._format_file_size(size)
-                out.write(f"{filename:<30} {path:<40} {size_display:<10} {compressed_status}\n")
+                lines.append(f"{filename:<30} {path:<40} {format_size(size):<10} {compressed_status}\n")
+            out.writelines(lines)
     
     def _export_csv_format(self, output_file, files):
         """
@@ -264,28 +308,14 @@ class RBTreeHandler(MenuHandler):
             output_file: Path to output file
             files: List of file information dictionaries
         """
-        import csv
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as out:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 16) as out:
             writer = csv.writer(out)
             
             # Write header
             writer.writerow(["Filename", "Path", "Size", "Compressed"])
             
-            # Write data
-            for file in files:
-                filename = file['filename']
-                metadata = file['metadata']
-                path = metadata.get('path', '')
-                size = metadata.get('size', 0)
-                compressed = metadata.get('compression_status', False)
-                
-                writer.writerow([
-                    filename,
-                    path,
-                    size,
-                    "Yes" if compressed else "No"
-                ])
+            # Write data; writerows drives the iteration from C
+            writer.writerows(_csv_rows(files))
     
     def _export_json_format(self, output_file, files):
         """
@@ -295,33 +325,34 @@ class RBTreeHandler(MenuHandler):
             output_file: Path to output file
             files: List of file information dictionaries
         """
-        import json
+        export_date = self._get_current_datetime()
         
-        # Convert to dictionaries
-        files_data = []
-        for file in files:
-            filename = file['filename']
-            metadata = file['metadata']
+        # Stream one entry at a time instead of materialising every row first.
+        # The layout matches json.dump(..., indent=2) of the whole document.
+        with open(output_file, 'w', encoding='utf-8') as out:
+            out.write('{\n  "total_files": %d,\n  "export_date": %s,\n  "files": ['
+                      % (len(files), json.dumps(export_date)))
             
-            files_data.append({
-                "filename": filename,
-                "path": metadata.get('path', ''),
-                "size": metadata.get('size', 0),
-                "compressed": metadata.get('compression_status', False),
-                "metadata": {
-                    "export_date": self._get_current_datetime(),
-                    "creation_date": metadata.get('creation_date', ''),
-                    "modified_date": metadata.get('modified_date', '')
+            separator = "\n    "
+            for file in files:
+                metadata = file['metadata']
+                entry = {
+                    "filename": file['filename'],
+                    "path": metadata.get('path', ''),
+                    "size": metadata.get('size', 0),
+                    "compressed": metadata.get('compression_status', False),
+                    "metadata": {
+                        "export_date": export_date,
+                        "creation_date": metadata.get('creation_date', ''),
+                        "modified_date": metadata.get('modified_date', '')
+                    }
                 }
-            })
-        
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as out:
-            json.dump({
-                "total_files": len(files),
-                "export_date": self._get_current_datetime(),
-                "files": files_data
-            }, out, indent=2)
+                out.write(separator)
+                # json.dumps escapes newlines inside strings, so re-indenting is safe
+                out.write(json.dumps(entry, indent=2).replace("\n", "\n    "))
+                separator = ",\n    "
+            
+            out.write("\n  ]\n}" if files else "]\n}")
     
     def _format_file_size(self, size_in_bytes):
         """
@@ -335,10 +366,9 @@ class RBTreeHandler(MenuHandler):
         """
         if size_in_bytes < 1024:
             return f"{size_in_bytes} B"
-        elif size_in_bytes < 1024 * 1024:
-            return f"{size_in_bytes / 1024:.2f} KB"
-        else:
-            return f"{size_in_bytes / (1024 * 1024):.2f} MB"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit = min((int(size_in_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_in_bytes / _SIZE_DIVISORS[unit]:.2f} {_SIZE_UNITS[unit]}"
     
     def _format_datetime(self, timestamp):
         """
@@ -350,8 +380,8 @@ class RBTreeHandler(MenuHandler):
         Returns:
             Formatted date/time string
         """
-        from datetime import datetime
-        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+        # Sub-second precision is not displayed, so quantize for a better cache hit rate
+        return _format_timestamp(int(timestamp))
     
     def _get_current_datetime(self):
         """
@@ -360,23 +390,22 @@ class RBTreeHandler(MenuHandler):
         Returns:
             Current date/time string
         """
-        from datetime import datetime
-        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return _now().strftime('%Y-%m-%d %H:%M:%S')
     
-    def _validate_file_exists(self, file_path):
+    def _safe_stat(self, file_path):
         """
-        Validate that a file exists
+        Stat a file without raising if it is missing or inaccessible
         
         Args:
-            file_path: Path to the file to check
+            file_path: Path to the file to stat
             
         Returns:
-            Boolean indicating if the file exists
+            os.stat_result for the file, or None if it cannot be stat'ed
         """
-        if not os.path.exists(file_path):
-            self._display_error_message(f"Error: File {file_path} does not exist.")
-            return False
-        return True
+        try:
+            return os.stat(file_path)
+        except (OSError, ValueError):
+            return None
     
     def _display_error_message(self, message):
         """
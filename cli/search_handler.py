@@ -3,12 +3,40 @@ Handler for unified search operations across multiple data structures
 """
 import os
 import time
+import codecs
 import datetime
+import functools
+import json
+import threading
+import webbrowser
+from bisect import bisect_left, bisect_right
+from collections import deque, OrderedDict
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import PurePath
 from cli.handler_base import MenuHandler
 from storage.red_black_tree import RedBlackTree
 from storage.btree import BTree
 from utils.config_manager import ConfigManager
 
+# Read-ahead hint for streamed content scans (POSIX only)
+_FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None) if hasattr(os, 'posix_fadvise') else None
+
+# Content scans open files read-only without updating their access time where supported
+_SCAN_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Bytes shown on each side of a match when an overlong line is reported
+_SNIPPET_CONTEXT = 200
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value):
+    """Parse an ISO date string, memoized since indexed dates repeat across searches"""
+    return datetime.datetime.fromisoformat(value)
+
+
 class SearchHandler(MenuHandler):
     """
     Handler for unified search operations across the system
@@ -32,20 +60,40 @@ class SearchHandler(MenuHandler):
         self.rbtree = RedBlackTree()
         self.btree = BTree(t=3)  # Fixed to use t=3 instead of min_degree=3
         
-        # Search history
-        self.search_history = []
+        # Search history (oldest entries drop off once max_history is reached)
         self.max_history = 10
+        self.search_history = deque(maxlen=self.max_history)
+        # Append-only log, one JSON entry per line, next to the config file
+        self._history_path = os.path.join(os.path.dirname(self.config_manager.config_file),
+                                          "search_history.jsonl")
+        self._history_log_lines = 0
         
         # Configuration settings
         self.max_file_size = 50 * 1024 * 1024  # 50MB default limit
         self.chunk_size = 1024 * 1024  # 1MB for reading chunks
+        
+        # Content-search match counts keyed by (path, mtime_ns, size, needle)
+        self._content_cache = OrderedDict()
+        self._content_cache_lock = threading.Lock()
+        self.max_content_cache_entries = 4096
+        
+        # Needle forms for the in-file content search, keyed by the last term
+        self._last_needle = None
+        
+        # Menu text and option dispatch are fixed, so build them once
+        self._menu_text = "\n".join(
+            ["=" * 60, " Unified Search Menu", "=" * 60]
+            + [f"{i}. {option}" for i, option in enumerate(self.options, 1)]
+            + ["0. Exit"])
+        self._handlers = {str(i): getattr(self, f"_handle_option_{i}")
+                          for i in range(1, len(self.options) + 1)}
     
     def _handle_option_1(self):
         """Handle search by filename"""
         print("\nSearch by Filename")
         print("=" * 50)
         
-        search_term = input("Enter filename or part of filename to search for: ").strip()
+        search_term = input("Enter filename or part of filename to search for (end with * for a prefix search): ").strip()
         if not search_term:
             print("Search term cannot be empty.")
             return
@@ -84,8 +132,7 @@ class SearchHandler(MenuHandler):
             b_results = self._search_btree_by_filename(search_term)
             if b_results:
                 # Avoid duplicates (file might be indexed in both trees)
-                existing_paths = [r['path'] for r in results]
-                unique_b_results = [r for r in b_results if r['path'] not in existing_paths]
+                unique_b_results = self._unique_by_path(results, b_results)
                 results.extend(unique_b_results)
                 print(f"Found {len(unique_b_results)} additional results in B-Tree.")
             else:
@@ -101,12 +148,15 @@ class SearchHandler(MenuHandler):
             print(f"{'Filename':<30} {'Size':>10} {'Location':<30}")
             print("-" * 70)
             
+            # One os.path.split per row gives both the name and its directory
+            row = "{:<30} {:>10} {:<30}".format
+            split = os.path.split
+            format_size = self._format_size
+            lines = []
             for result in results:
-                filename = os.path.basename(result['path'])
-                size = self._format_size(result.get('size', 0))
-                location = os.path.dirname(result['path'])
-                
-                print(f"{filename:<30} {size:>10} {location:<30}")
+                location, filename = split(result['path'])
+                lines.append(row(filename, format_size(result.get('size', 0)), location))
+            print("\n".join(lines))
             
             # Ask if user wants to perform operations on results
             if len(results) > 0:
@@ -118,7 +168,7 @@ class SearchHandler(MenuHandler):
         self._add_to_search_history({
             'term': search_term,
             'type': 'filename',
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': time.time(),
             'results_count': len(results),
             'search_time': search_time
         })
@@ -169,12 +219,13 @@ class SearchHandler(MenuHandler):
             print(f"{'Filename':<30} {'Matches':>8} {'Path':<30}")
             print("-" * 70)
             
-            for result in sorted(results, key=lambda x: x['matches'], reverse=True):
-                filename = os.path.basename(result['path'])
-                matches = result['matches']
-                path = os.path.dirname(result['path'])
-                
-                print(f"{filename:<30} {matches:>8} {path:<30}")
+            row = "{:<30} {:>8} {:<30}".format
+            split = os.path.split
+            lines = []
+            for result in sorted(results, key=itemgetter('matches'), reverse=True):
+                path, filename = split(result['path'])
+                lines.append(row(filename, result['matches'], path))
+            print("\n".join(lines))
             
             # Ask if user wants to perform operations on results
             self._offer_result_actions(results)
@@ -186,7 +237,7 @@ class SearchHandler(MenuHandler):
             'term': search_term,
             'type': 'content',
             'extensions': extensions,
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': time.time(),
             'results_count': len(results) if results else 0
         })
         
@@ -251,11 +302,13 @@ class SearchHandler(MenuHandler):
         # Get candidate files from indexed storage
         candidates = self._get_all_indexed_files()
         
-        # Apply filters
-        results = []
-        for file_info in candidates:
-            if self._matches_search_criteria(file_info, search):
-                results.append(file_info)
+        # Apply all metadata filters in one pass before any file is opened
+        prepared = self._prepare_search_criteria(search)
+        results = self._prefilter_candidates(candidates, search, prepared)
+        
+        # Only files passing every cheap check have their content scanned
+        if prepared['content']:
+            results = self._filter_by_content(results, prepared['content'])
         
         # Calculate search time
         search_time = time.time() - start_time
@@ -267,15 +320,17 @@ class SearchHandler(MenuHandler):
             print(f"{'Filename':<25} {'Size':>10} {'Modified':>20} {'Path':<30}")
             print("-" * 70)
             
+            row = "{:<25} {:>10} {:>20} {:<30}".format
+            split = os.path.split
+            format_size = self._format_size
+            lines = []
             for result in results:
-                filename = os.path.basename(result['path'])
-                size = self._format_size(result.get('size', 0))
+                path, filename = split(result['path'])
                 modified = result.get('modified_date', 'Unknown')
                 if isinstance(modified, datetime.datetime):
                     modified = modified.strftime("%Y-%m-%d %H:%M")
-                path = os.path.dirname(result['path'])
-                
-                print(f"{filename:<25} {size:>10} {modified:>20} {path:<30}")
+                lines.append(row(filename, format_size(result.get('size', 0)), modified, path))
+            print("\n".join(lines))
             
             # Ask if user wants to perform operations on results
             self._offer_result_actions(results)
@@ -286,7 +341,7 @@ class SearchHandler(MenuHandler):
         self._add_to_search_history({
             'type': 'advanced',
             'criteria': search,
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': time.time(),
             'results_count': len(results),
             'search_time': search_time
         })
@@ -309,7 +364,7 @@ class SearchHandler(MenuHandler):
         print("-" * 70)
         
         for i, search in enumerate(self.search_history):
-            timestamp = datetime.datetime.fromisoformat(search['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = self._format_history_timestamp(search['timestamp'])
             search_type = search['type'].capitalize()
             
             if search_type == "Advanced":
@@ -352,56 +407,230 @@ class SearchHandler(MenuHandler):
     
     def _search_rbtree_by_filename(self, search_term):
         """Search Red-Black Tree by filename"""
-        results = []
-        def _search_node(node):
-            if node is None or node == self.rbtree.NIL:
-                return
-            # Check if the filename contains the search term
-            if search_term.lower() in node.filename.lower():
-                results.append({
-                    'filename': node.filename,
-                    'path': node.metadata.get('path', ''),
-                    'size': node.metadata.get('size', 0),
-                    'compression_status': node.metadata.get('compression_status', False)
-                })
+        prefix = self._get_prefix_pattern(search_term)
+        if prefix is not None:
+            return [{
+                'filename': node.filename,
+                'path': node.metadata.get('path', ''),
+                'size': node.metadata.get('size', 0),
+                'compression_status': node.metadata.get('compression_status', False)
+            } for node in self._rbtree_prefix_search(prefix)]
+        
+        # Skip the walk when no indexed filename can contain the term
+        if not self._might_match_filename(self.rbtree, search_term):
+            return []
+        
+        nodes = []
+        append = nodes.append
+        nil = self.rbtree.NIL
+        
+        # Walk the tree with an explicit stack (pre-order: node, left, right)
+        stack = deque([self.rbtree.root])
+        while stack:
+            node = stack.pop()
+            if node is None or node == nil:
+                continue
+            append(node)
             # Continue searching in both subtrees
-            _search_node(node.left)
-            _search_node(node.right)
+            stack.append(node.right)
+            stack.append(node.left)
+        
+        # Check which filenames contain the search term
+        results = []
+        for i in self._match_filenames([node.filename for node in nodes], search_term.lower()):
+            node = nodes[i]
+            metadata = node.metadata
+            results.append({
+                'filename': node.filename,
+                'path': metadata.get('path', ''),
+                'size': metadata.get('size', 0),
+                'compression_status': metadata.get('compression_status', False)
+            })
         
-        # Start the search from the root of the Red-Black Tree
-        _search_node(self.rbtree.root)
         return results
     
     def _search_btree_by_filename(self, search_term):
         """Search B-Tree by filename"""
-        results = []
-        # Define a recursive function to search in B-Tree nodes
-        def _search_node(node):
+        prefix = self._get_prefix_pattern(search_term)
+        if prefix is not None:
+            return [{
+                'filename': filename,
+                'path': metadata.get('path', ''),
+                'size': metadata.get('size', 0),
+                'compression_status': metadata.get('compression_status', False),
+                'modified_date': metadata.get('creation_date', '')
+            } for filename, metadata in self._btree_prefix_search(prefix)]
+        
+        # Skip the walk when no indexed filename can contain the term
+        if not self._might_match_filename(self.btree, search_term):
+            return []
+        
+        filenames = []
+        entries = []
+        
+        # Walk the B-Tree nodes with an explicit stack, children in key order
+        stack = deque([self.btree.root])
+        while stack:
+            node = stack.pop()
             if node is None:
-                return
-            # Check each key in the node
-            for i in range(len(node.keys)):
-                filename = node.keys[i]
-                if i < len(node.values):  # Ensure there's a corresponding value
-                    metadata = node.values[i]
-                    # If the filename contains the search term, add to results
-                    if search_term.lower() in filename.lower():
-                        results.append({
-                            'filename': filename,
-                            'path': metadata.get('path', ''),
-                            'size': metadata.get('size', 0),
-                            'compression_status': metadata.get('compression_status', False),
-                            'modified_date': metadata.get('creation_date', '')
-                        })
+                continue
+            # Collect each key in the node (zip skips keys without a value)
+            for filename, metadata in zip(node.keys, node.values):
+                filenames.append(filename)
+                entries.append(metadata)
             # Continue searching in child nodes
             if not node.leaf:
-                for child in node.children:
-                    _search_node(child)
+                stack.extend(reversed(node.children))
+        
+        # If the filename contains the search term, add to results
+        needle = search_term.lower()
+        results = []
+        for i in self._match_filenames(filenames, needle):
+            metadata = entries[i]
+            results.append({
+                'filename': filenames[i],
+                'path': metadata.get('path', ''),
+                'size': metadata.get('size', 0),
+                'compression_status': metadata.get('compression_status', False),
+                'modified_date': metadata.get('creation_date', '')
+            })
         
-        # Start the search from the root of the B-Tree
-        _search_node(self.btree.root)
         return results
     
+    def _might_match_filename(self, tree, search_term):
+        """
+        Ask the tree's filename Bloom filter whether a search can match
+        
+        Args:
+            tree: The Red-Black Tree or B-Tree about to be searched
+            search_term: The substring being searched for
+            
+        Returns:
+            False only if no indexed filename can contain the term
+        """
+        name_filter = getattr(tree, 'name_filter', None)
+        if name_filter is None:
+            return True
+        return name_filter.might_contain(search_term)
+    
+    def _get_prefix_pattern(self, search_term):
+        """
+        Detect a prefix query such as "report*"
+        
+        Prefix queries use the trees' key order instead of scanning every
+        node. Like the tree keys themselves, they are case-sensitive.
+        
+        Args:
+            search_term: The term entered by the user
+            
+        Returns:
+            The prefix string, or None for a regular substring search
+        """
+        if len(search_term) < 2 or not search_term.endswith('*'):
+            return None
+        prefix = search_term[:-1]
+        if '*' in prefix or '?' in prefix:
+            return None
+        return prefix
+    
+    def _rbtree_prefix_search(self, prefix):
+        """
+        Yield Red-Black Tree nodes whose filename starts with prefix, in order
+        
+        Descends to the first filename >= prefix and walks in-order from
+        there, stopping at the first filename without the prefix.
+        """
+        nil = self.rbtree.NIL
+        stack = []
+        node = self.rbtree.root
+        while node is not None and node != nil:
+            if node.filename >= prefix:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        
+        while stack:
+            node = stack.pop()
+            if not node.filename.startswith(prefix):
+                return
+            yield node
+            
+            # Queue the in-order successors from the right subtree
+            child = node.right
+            while child is not None and child != nil:
+                stack.append(child)
+                child = child.left
+    
+    def _btree_prefix_search(self, prefix):
+        """
+        Yield (filename, metadata) pairs from the B-Tree whose key starts with prefix
+        
+        Keys are visited in sorted order starting from the first key >= prefix,
+        and the walk stops at the first key without the prefix.
+        """
+        for filename, metadata in self._btree_iter_from(self.btree.root, prefix):
+            if not filename.startswith(prefix):
+                return
+            yield filename, metadata
+    
+    def _btree_iter_from(self, node, start_key):
+        """Lazily yield B-Tree (key, value) pairs in order, beginning at start_key"""
+        if node is None:
+            return
+        
+        # Skip keys (and their left subtrees) that sort before start_key;
+        # keys within a node are sorted, so bisect finds the position
+        i = bisect_left(node.keys, start_key)
+        
+        for j in range(i, len(node.keys)):
+            if not node.leaf:
+                yield from self._btree_iter_from(node.children[j], start_key)
+            if j < len(node.values):
+                yield node.keys[j], node.values[j]
+        
+        if not node.leaf and len(node.keys) < len(node.children):
+            yield from self._btree_iter_from(node.children[len(node.keys)], start_key)
+    
+    def _match_filenames(self, filenames, needle):
+        """
+        Find the filenames that contain a lowercased needle (case-insensitive)
+        
+        The names are joined into one NUL-separated buffer that is lowercased
+        and scanned with str.find, so the matching loop runs in C and only
+        visits the names that actually match.
+        
+        Args:
+            filenames: List of filenames in traversal order
+            needle: Lowercased search term
+            
+        Returns:
+            List of indices into filenames, in ascending order
+        """
+        if not filenames:
+            return []
+        
+        separator = "\0"
+        buffer = separator.join(filenames).lower()
+        # Fall back to a per-name check if lowercasing changed lengths or a
+        # name/needle contains the separator, since offsets would be wrong
+        if (separator in needle or len(buffer) != sum(map(len, filenames)) + len(filenames) - 1
+                or buffer.count(separator) != len(filenames) - 1):
+            return [i for i, filename in enumerate(filenames) if needle in filename.lower()]
+        
+        # Start offset of every name inside the buffer
+        starts = list(accumulate((len(filename) + 1 for filename in filenames[:-1]), initial=0))
+        
+        matches = []
+        pos = buffer.find(needle)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            matches.append(index)
+            if index + 1 == len(starts):
+                break
+            pos = buffer.find(needle, starts[index + 1])
+        return matches
+    
     def _search_indexed_files_by_content(self, search_term, extensions=None):
         """Search indexed files by content"""
         results = []
@@ -415,126 +644,112 @@ class SearchHandler(MenuHandler):
         b_results = self._search_btree_by_content(search_term, extensions)
         if b_results:
             # Avoid duplicates
-            existing_paths = [r['path'] for r in results]
-            unique_b_results = [r for r in b_results if r['path'] not in existing_paths]
+            unique_b_results = self._unique_by_path(results, b_results)
             results.extend(unique_b_results)
         
         return results
         
+    def _unique_by_path(self, existing, new_results):
+        """
+        Return the entries of new_results whose path is not already in existing
+        
+        The hash set is built from whichever list is smaller, which keeps it
+        small when one tree returns far more hits than the other.
+        
+        Args:
+            existing: Results already collected (these win on duplicates)
+            new_results: Results to filter
+            
+        Returns:
+            List of entries from new_results, in their original order
+        """
+        if len(existing) <= len(new_results):
+            seen = {r['path'] for r in existing}
+        else:
+            new_paths = {r['path'] for r in new_results}
+            seen = {r['path'] for r in existing if r['path'] in new_paths}
+        return [r for r in new_results if r['path'] not in seen]
+    
     def _search_rbtree_by_content(self, search_term, extensions=None):
         """Search Red-Black Tree files by content"""
-        results = []
-        
-        def _search_node(node):
-            if node is None or node == self.rbtree.NIL:
-                return
+        candidates = []
+        nil = self.rbtree.NIL
+        extensions = tuple(extensions) if extensions else None
+        
+        stack = deque([self.rbtree.root])
+        while stack:
+            node = stack.pop()
+            if node is None or node == nil:
+                continue
+            stack.append(node.right)
+            stack.append(node.left)
                 
             # Process current node
             file_path = node.metadata.get('path', '')
             
             # Skip files that don't match the extension filter
-            if extensions and not any(file_path.endswith(ext) for ext in extensions):
-                pass  # Skip this file
-            elif file_path:
-                # Read the file content and search for the term
-                try:
-                    # First try to read as text
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as file:
-                            content = file.read()
-                            if search_term.lower() in content.lower():
-                                results.append({
-                                    'filename': node.filename,
-                                    'path': file_path,
-                                    'size': node.metadata.get('size', 0),
-                                    'compression_status': node.metadata.get('compression_status', False),
-                                    'modified_date': node.metadata.get('creation_date', ''),
-                                    'matches': content.lower().count(search_term.lower())
-                                })
-                    except UnicodeDecodeError:
-                        # If text reading fails, try binary mode
-                        with open(file_path, 'rb') as file:
-                            binary_content = file.read()
-                            str_content = str(binary_content)
-                            if search_term.lower() in str_content.lower():
-                                results.append({
-                                    'filename': node.filename,
-                                    'path': file_path,
-                                    'size': node.metadata.get('size', 0),
-                                    'compression_status': node.metadata.get('compression_status', False),
-                                    'modified_date': node.metadata.get('creation_date', ''),
-                                    'matches': str_content.lower().count(search_term.lower())
-                                })
-                except Exception as e:
-                    print(f"Error reading file {file_path}: {e}")
-            
-            # Continue searching in both subtrees
-            _search_node(node.left)
-            _search_node(node.right)
-            
-        # Start the search from the root
-        _search_node(self.rbtree.root)
-        return results
+            if extensions and not file_path.endswith(extensions):
+                continue
+            if file_path:
+                candidates.append((node.filename, file_path, node.metadata))
+        
+        return self._collect_content_matches(candidates, search_term.lower())
         
     def _search_btree_by_content(self, search_term, extensions=None):
         """Search B-Tree files by content"""
-        results = []
+        candidates = []
+        extensions = tuple(extensions) if extensions else None
         
-        def _search_node(node):
+        stack = deque([self.btree.root])
+        while stack:
+            node = stack.pop()
             if node is None:
-                return
+                continue
+                
+            # Process keys and values in this node (zip skips keys without a value)
+            for filename, metadata in zip(node.keys, node.values):
+                file_path = metadata.get('path', '')
                 
-            # Process keys and values in this node
-            for i in range(len(node.keys)):
-                if i < len(node.values):  # Make sure there's a corresponding value
-                    filename = node.keys[i]
-                    metadata = node.values[i]
-                    file_path = metadata.get('path', '')
+                # Skip files that don't match the extension filter
+                if extensions and not file_path.endswith(extensions):
+                    continue
                     
-                    # Skip files that don't match the extension filter
-                    if extensions and not any(file_path.endswith(ext) for ext in extensions):
-                        continue
-                        
-                    if file_path:
-                        # Read the file content and search for the term
-                        try:
-                            # First try to read as text
-                            try:
-                                with open(file_path, 'r', encoding='utf-8') as file:
-                                    content = file.read()
-                                    if search_term.lower() in content.lower():
-                                        results.append({
-                                            'filename': filename,
-                                            'path': file_path,
-                                            'size': metadata.get('size', 0),
-                                            'compression_status': metadata.get('compression_status', False),
-                                            'modified_date': metadata.get('creation_date', ''),
-                                            'matches': content.lower().count(search_term.lower())
-                                        })
-                            except UnicodeDecodeError:
-                                # If text reading fails, try binary mode
-                                with open(file_path, 'rb') as file:
-                                    binary_content = file.read()
-                                    str_content = str(binary_content)
-                                    if search_term.lower() in str_content.lower():
-                                        results.append({
-                                            'filename': filename,
-                                            'path': file_path,
-                                            'size': metadata.get('size', 0),
-                                            'compression_status': metadata.get('compression_status', False),
-                                            'modified_date': metadata.get('creation_date', ''),
-                                            'matches': str_content.lower().count(search_term.lower())
-                                        })
-                        except Exception as e:
-                            print(f"Error reading file {file_path}: {e}")
+                if file_path:
+                    candidates.append((filename, file_path, metadata))
             
             # Continue searching in child nodes
             if not node.leaf:
-                for child in node.children:
-                    _search_node(child)
+                stack.extend(reversed(node.children))
                     
-        # Start the search from the root
-        _search_node(self.btree.root)
+        return self._collect_content_matches(candidates, search_term.lower())
+    
+    def _collect_content_matches(self, candidates, needle):
+        """
+        Scan indexed files for a term and build result entries
+        
+        Args:
+            candidates: List of (filename, file_path, metadata) tuples
+            needle: Lowercased search term
+            
+        Returns:
+            List of result dictionaries for files containing the term
+        """
+        results = []
+        scans = self._scan_files([file_path for _, file_path, _ in candidates], needle)
+        
+        for (filename, file_path, metadata), (matches, error) in zip(candidates, scans):
+            if error is not None:
+                print(f"Error reading file {file_path}: {error}")
+            elif matches:
+                results.append({
+                    'filename': filename,
+                    'path': file_path,
+                    'size': metadata.get('size', 0),
+                    'compression_status': metadata.get('compression_status', False),
+                    'modified_date': metadata.get('creation_date', ''),
+                    'matches': matches
+                })
+        
         return results
     
     def _search_directory_by_content(self, directory, search_term, extensions=None):
@@ -542,147 +757,372 @@ class SearchHandler(MenuHandler):
         results = []
         
         # Walk through all files in the directory
-        for root, _, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                # Skip files that don't match the extension filter
-                if extensions and not any(file.endswith(ext) for ext in extensions):
-                    continue
-                    
-                # Read the file content and search for the term
-                try:
-                    # First try to read as text
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if search_term.lower() in content.lower():
-                                # Get file stats
-                                stats = os.stat(file_path)
-                                results.append({
-                                    'filename': file,
-                                    'path': file_path,
-                                    'size': stats.st_size,
-                                    'compression_status': file.endswith('.gz') or file.endswith('.zip'),
-                                    'modified_date': datetime.datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                                    'matches': content.lower().count(search_term.lower())
-                                })
-                    except UnicodeDecodeError:
-                        # If text reading fails, try binary mode
-                        with open(file_path, 'rb') as f:
-                            binary_content = f.read()
-                            str_content = str(binary_content)
-                            if search_term.lower() in str_content.lower():
-                                # Get file stats
-                                stats = os.stat(file_path)
-                                results.append({
-                                    'filename': file,
-                                    'path': file_path,
-                                    'size': stats.st_size,
-                                    'compression_status': file.endswith('.gz') or file.endswith('.zip'),
-                                    'modified_date': datetime.datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                                    'matches': str_content.lower().count(search_term.lower())
-                                })
-                except Exception as e:
-                    print(f"Error reading file {file_path}: {e}")
+        candidates = []
+        extensions = tuple(extensions) if extensions else None
+        for entry in self._iter_files(directory):
+            # Skip files that don't match the extension filter
+            if extensions and not entry.name.endswith(extensions):
+                continue
+            candidates.append(entry)
+        
+        scans = self._scan_files([entry.path for entry in candidates], search_term.lower())
+        
+        for entry, (matches, error) in zip(candidates, scans):
+            file, file_path = entry.name, entry.path
+            if error is not None:
+                print(f"Error reading file {file_path}: {error}")
+                continue
+            if not matches:
+                continue
+            
+            try:
+                # Get file stats (cached on the directory entry)
+                stats = entry.stat()
+                results.append({
+                    'filename': file,
+                    'path': file_path,
+                    'size': stats.st_size,
+                    'compression_status': file.endswith(('.gz', '.zip')),
+                    'modified_date': datetime.datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                    'matches': matches
+                })
+            except Exception as e:
+                print(f"Error reading file {file_path}: {e}")
                     
         return results
+    
+    def _iter_files(self, directory):
+        """
+        Yield os.DirEntry objects for every file below a directory
+        
+        Uses os.scandir so the entry type comes from the directory listing
+        instead of a stat per entry. Order matches os.walk: a directory's
+        files first, then its subdirectories; symlinked directories are not
+        followed and unreadable directories are skipped.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            return
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry
+            elif not entry.is_symlink():
+                subdirs.append(entry.path)
+        
+        for subdir in subdirs:
+            yield from self._iter_files(subdir)
+    
+    def _scan_files(self, file_paths, needle):
+        """
+        Count matches in several files concurrently
+        
+        File reads and bytes.count release the GIL, so a thread pool overlaps
+        the I/O of many files.
+        
+        Args:
+            file_paths: List of file paths to scan
+            needle: Lowercased search term
+            
+        Returns:
+            List of (matches, error) tuples in the same order as file_paths
+        """
+        if len(file_paths) < 2:
+            return [self._scan_one(file_path, needle) for file_path in file_paths]
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda file_path: self._scan_one(file_path, needle), file_paths))
+    
+    def _scan_one(self, file_path, needle):
+        """
+        Count matches in a single file without raising
+        
+        Returns:
+            Tuple of (matches, error); error is None on success
+        """
+        try:
+            return self._count_matches_in_file(file_path, needle), None
+        except Exception as e:
+            return 0, e
 
-    def _matches_search_criteria(self, file_info, criteria):
-        """Check if a file matches the advanced search criteria"""
-        # Check filename
-        if criteria['filename'] and criteria['filename'].lower() not in os.path.basename(file_info['path']).lower():
-            return False
-        
-        # Check content (for advanced search, we might need to read the file)
-        if criteria['content']:
+    def _count_matches_in_file(self, file_path, needle):
+        """
+        Count case-insensitive occurrences of a lowercased needle in a file
+        
+        Args:
+            file_path: Path of the file to scan
+            needle: Search term, already lowercased
+            
+        Returns:
+            Number of non-overlapping matches (0 if none)
+        """
+        # Unchanged files (same mtime and size) reuse the previous count
+        stats = os.stat(file_path)
+        key = (file_path, stats.st_mtime_ns, stats.st_size, needle)
+        with self._content_cache_lock:
+            matches = self._content_cache.get(key)
+            if matches is not None:
+                self._content_cache.move_to_end(key)
+                return matches
+        
+        if needle.isascii():
+            matches = self._count_in_stream(file_path, needle.encode('ascii'), stats.st_size)
+        else:
+            # bytes.lower() only folds ASCII, so other terms need the decoded text
             try:
-                # First try to read as text
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    matches = file.read().lower().count(needle)
+            except UnicodeDecodeError:
+                # If text reading fails, search the raw bytes directly
+                with open(file_path, 'rb') as file:
+                    matches = file.read().lower().count(needle.encode('utf-8'))
+        
+        with self._content_cache_lock:
+            self._content_cache[key] = matches
+            if len(self._content_cache) > self.max_content_cache_entries:
+                self._content_cache.popitem(last=False)
+        
+        return matches
+    
+    def invalidate_content_cache(self, file_path=None):
+        """
+        Drop cached content-search counts
+        
+        Args:
+            file_path: Only drop entries for this path; None clears everything
+        """
+        with self._content_cache_lock:
+            if file_path is None:
+                self._content_cache.clear()
+                return
+            for key in [key for key in self._content_cache if key[0] == file_path]:
+                del self._content_cache[key]
+    
+    def _open_for_scan(self, file_path):
+        """
+        Open a file descriptor for a read-only content scan
+        
+        O_NOATIME is only allowed on files owned by the caller, so the open
+        falls back to plain read-only flags when the kernel refuses it.
+        
+        Args:
+            file_path: Path of the file to open
+            
+        Returns:
+            Raw file descriptor; the caller must close it
+        """
+        if _O_NOATIME:
+            try:
+                return os.open(file_path, _SCAN_OPEN_FLAGS | _O_NOATIME)
+            except PermissionError:
+                pass
+        return os.open(file_path, _SCAN_OPEN_FLAGS)
+    
+    def _count_in_stream(self, file_path, needle_bytes, size=None):
+        """
+        Count occurrences of a lowercased byte needle, reading the file in chunks
+        
+        Memory use stays at one chunk regardless of file size. The last
+        len(needle) - 1 bytes of each chunk are carried into the next one so
+        matches straddling a chunk boundary are still found; bytes of the last
+        counted match are never carried, so the total equals a whole-file
+        bytes.count even for terms that overlap themselves (e.g. "aa").
+        
+        Args:
+            file_path: Path of the file to scan
+            needle_bytes: Lowercased ASCII search term as bytes
+            size: Known file size in bytes; reading stops there, so files
+                that fit in one chunk take a single read call
+            
+        Returns:
+            Number of non-overlapping matches (0 if none)
+        """
+        needle_len = len(needle_bytes)
+        total = 0
+        tail = b""
+        remaining = size
+        
+        # A needle whose prefix equals its suffix can occur inside the overlap
+        # of two occurrences; rfind may then return one that was never counted
+        self_overlapping = any(needle_bytes[:k] == needle_bytes[-k:] for k in range(1, needle_len))
+        
+        fd = self._open_for_scan(file_path)
+        try:
+            if _FADV_SEQUENTIAL is not None:
+                # Let the kernel read ahead aggressively; we scan front to back once
                 try:
-                    with open(file_info['path'], 'r', encoding='utf-8') as file:
-                        content = file.read()
-                        if criteria['content'].lower() not in content.lower():
-                            return False
-                except UnicodeDecodeError:
-                    # If text reading fails, try binary mode
-                    with open(file_info['path'], 'rb') as file:
-                        binary_content = file.read()
-                        str_content = str(binary_content)
-                        if criteria['content'].lower() not in str_content.lower():
-                            return False
-            except Exception as e:
-                print(f"Error reading file {file_info['path']} for content search: {e}")
-                return False
-        
-        # Check size
-        size = file_info.get('size', 0)
-        if criteria['min_size'] and size < criteria['min_size']:
-            return False
-        if criteria['max_size'] and size > criteria['max_size']:
-            return False
-        
-        # Check extensions
-        if criteria['extensions'] and not any(file_info['path'].endswith(ext) for ext in criteria['extensions']):
-            return False
-        
-        # Check modified date
-        if criteria['modified_after'] and file_info.get('modified_date'):
-            modified_date = file_info['modified_date']
-            if isinstance(modified_date, str):
-                modified_date = datetime.datetime.fromisoformat(modified_date)
-            if modified_date <= criteria['modified_after']:
-                return False
-        
-        return True
+                    os.posix_fadvise(fd, 0, 0, _FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            
+            while remaining is None or remaining > 0:
+                chunk = os.read(fd, self.chunk_size if remaining is None else min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                
+                buffer = tail + chunk.lower()
+                if self_overlapping:
+                    # Walk the counted matches so the end of the last one is known
+                    match_end = 0
+                    pos = buffer.find(needle_bytes)
+                    while pos != -1:
+                        total += 1
+                        match_end = pos + needle_len
+                        pos = buffer.find(needle_bytes, match_end)
+                else:
+                    total += buffer.count(needle_bytes)
+                    last = buffer.rfind(needle_bytes)
+                    match_end = last + needle_len if last != -1 else 0
+                
+                # Carry the boundary bytes, but never re-use bytes of a counted match
+                tail = buffer[max(match_end, len(buffer) - needle_len + 1, 0):]
+        finally:
+            os.close(fd)
+        
+        return total
+
+    def _prefilter_candidates(self, candidates, criteria, prepared):
+        """
+        Apply the filename, size, extension and date criteria in one pass
+        
+        Each candidate is checked against every metadata criterion in a
+        single loop, and no file is opened here.
+        
+        Args:
+            candidates: List of file information dictionaries
+            criteria: Advanced search criteria dictionary
+            prepared: Result of _prepare_search_criteria for the same criteria
+            
+        Returns:
+            List of candidates passing the metadata criteria, in order
+        """
+        filename = prepared['filename']
+        extensions = prepared['extensions']
+        min_size = criteria['min_size']
+        max_size = criteria['max_size']
+        modified_after = criteria['modified_after']
+        
+        results = []
+        for file_info in candidates:
+            if filename and filename not in os.path.basename(file_info['path']).lower():
+                continue
+            size = file_info.get('size', 0)
+            if min_size and size < min_size:
+                continue
+            if max_size and size > max_size:
+                continue
+            if extensions and not file_info['path'].endswith(extensions):
+                continue
+            if modified_after and file_info.get('modified_date'):
+                modified_date = file_info['modified_date']
+                if isinstance(modified_date, str):
+                    modified_date = _parse_iso(modified_date)
+                if modified_date <= modified_after:
+                    continue
+            results.append(file_info)
+        
+        return results
+    
+    def _prepare_search_criteria(self, criteria):
+        """
+        Precompute the per-search parts of advanced search criteria
+        
+        Lowercasing the needles once per search instead of once per
+        candidate keeps the per-file checks down to plain substring tests.
+        
+        Args:
+            criteria: Advanced search criteria dictionary
+            
+        Returns:
+            Dictionary with lowercased 'filename' and 'content' needles and
+            the extensions as a tuple for str.endswith
+        """
+        return {
+            'filename': (criteria['filename'] or '').lower(),
+            'content': (criteria['content'] or '').lower(),
+            'extensions': tuple(criteria['extensions']) if criteria['extensions'] else None,
+        }
+
+    def _filter_by_content(self, candidates, needle):
+        """
+        Keep the candidates whose content contains a lowercased needle
+        
+        The files are scanned concurrently with _scan_files; unreadable
+        files are reported and dropped.
+        
+        Args:
+            candidates: List of file information dictionaries
+            needle: Lowercased content search term
+            
+        Returns:
+            List of matching candidates, in order
+        """
+        scans = self._scan_files([file_info['path'] for file_info in candidates], needle)
+        results = []
+        for file_info, (matches, error) in zip(candidates, scans):
+            if error is not None:
+                print(f"Error reading file {file_info['path']} for content search: {error}")
+            elif matches:
+                results.append(file_info)
+        return results
     
     def _get_all_indexed_files(self):
         """Get a list of all indexed files from both Red-Black Tree and B-Tree"""
         all_files = []
-        
-        # Traverse Red-Black Tree
-        def _traverse_rbtree(node):
-            if node is None or node == self.rbtree.NIL:
-                return
+        append = all_files.append
+        nil = self.rbtree.NIL
+        
+        # Traverse Red-Black Tree (pre-order, iteratively)
+        stack = deque([self.rbtree.root])
+        while stack:
+            node = stack.pop()
+            if node is None or node == nil:
+                continue
             
             # Add current node
-            all_files.append({
+            metadata = node.metadata
+            append({
                 'filename': node.filename,
-                'path': node.metadata.get('path', ''),
-                'size': node.metadata.get('size', 0),
-                'compression_status': node.metadata.get('compression_status', False),
-                'modified_date': node.metadata.get('creation_date', '')
+                'path': metadata.get('path', ''),
+                'size': metadata.get('size', 0),
+                'compression_status': metadata.get('compression_status', False),
+                'modified_date': metadata.get('creation_date', '')
             })
             
             # Traverse left and right subtrees
-            _traverse_rbtree(node.left)
-            _traverse_rbtree(node.right)
-        
-        # Start traversal from the root
-        _traverse_rbtree(self.rbtree.root)
+            stack.append(node.right)
+            stack.append(node.left)
         
         # Traverse B-Tree
-        def _traverse_btree(node):
+        stack = deque([self.btree.root])
+        while stack:
+            node = stack.pop()
             if node is None:
-                return
+                continue
                 
-            # Process the keys and values in this node
-            for i in range(len(node.keys)):
-                if i < len(node.values):  # Make sure there's a corresponding value
-                    metadata = node.values[i]
-                    all_files.append({
-                        'filename': node.keys[i],
-                        'path': metadata.get('path', ''),
-                        'size': metadata.get('size', 0),
-                        'compression_status': metadata.get('compression_status', False),
-                        'modified_date': metadata.get('creation_date', '')
-                    })
+            # Process the keys and values in this node (zip skips keys without a value)
+            for filename, metadata in zip(node.keys, node.values):
+                append({
+                    'filename': filename,
+                    'path': metadata.get('path', ''),
+                    'size': metadata.get('size', 0),
+                    'compression_status': metadata.get('compression_status', False),
+                    'modified_date': metadata.get('creation_date', '')
+                })
             
             # Traverse children if not a leaf node
             if not node.leaf:
-                for child in node.children:
-                    _traverse_btree(child)
-        
-        _traverse_btree(self.btree.root)
+                stack.extend(reversed(node.children))
         
         return all_files
     
@@ -712,15 +1152,17 @@ class SearchHandler(MenuHandler):
     
     def _open_file_location(self, results):
         """Open the file location in the file explorer"""
-        import webbrowser
-        
-        for result in results:
-            path = result['path']
-            # On Windows, use file:///C:/path/to/file
-            # On macOS, use file:///Users/username/path/to/file
-            # On Linux, use file:///home/username/path/to/file
-            url = f"file:///{path.replace(os.sep, '/')}"  # Convert to URL format
-            webbrowser.open(url)
+        # Open each containing directory once, however many results it holds
+        directories = list(dict.fromkeys(os.path.dirname(result['path']) for result in results))
+        
+        for directory in directories:
+            if hasattr(os, 'startfile'):
+                # Windows: hand the folder straight to the shell
+                os.startfile(directory or '.')
+                continue
+            # as_uri percent-quotes the path and needs it absolute,
+            # e.g. file:///home/username/path/to/dir
+            webbrowser.open(PurePath(os.path.abspath(directory)).as_uri())
         
         print("\nFile locations opened in file explorer.")
         print("\nPress Enter to continue...")
@@ -743,6 +1185,7 @@ class SearchHandler(MenuHandler):
             path = result['path']
             # Remove from index logic here (e.g., delete from storage, remove from trees, etc.)
             # For demonstration, we'll just print the action
+            self.invalidate_content_cache(path)
             print(f"Removed from index: {path}")
         
         print("\nPress Enter to continue...")
@@ -755,25 +1198,40 @@ class SearchHandler(MenuHandler):
             print("Search term cannot be empty.")
             return
         
+        needle, needle_bytes, first_bytes = self._prepare_line_needle(search_term)
+        
         for result in results:
             path = result['path']
             try:
+                if needle_bytes is not None:
+                    # Scan raw blocks so only the matching lines are ever decoded
+                    is_text, found, lines = self._find_matching_lines(path, needle_bytes, first_bytes)
+                    if found and is_text:
+                        print(f"Found in {path}:")
+                        for line in lines:
+                            print(f"  {line}")
+                    elif found:
+                        print(f"Found in binary file {path}")
+                        print("  Note: Cannot display line context for binary files")
+                    continue
+                
                 # First try to read as text
                 try:
                     with open(path, 'r', encoding='utf-8') as file:
                         content = file.read()
-                        if search_term.lower() in content.lower():
+                        if needle in content.lower():
                             print(f"Found in {path}:")
                             # Print the matching line(s)
                             for line in content.splitlines():
-                                if search_term.lower() in line.lower():
+                                if needle in line.lower():
                                     print(f"  {line.strip()}")
                 except UnicodeDecodeError:
                     # If text reading fails, try binary mode
                     with open(path, 'rb') as file:
                         binary_content = file.read()
-                        str_content = str(binary_content)
-                        if search_term.lower() in str_content.lower():
+                        # Map each byte to one character rather than escaping it
+                        str_content = binary_content.decode('latin-1')
+                        if needle in str_content.lower():
                             print(f"Found in binary file {path}")
                             print("  Note: Cannot display line context for binary files")
             except Exception as e:
@@ -782,28 +1240,207 @@ class SearchHandler(MenuHandler):
         print("\nPress Enter to continue...")
         input()
     
+    def _prepare_line_needle(self, search_term):
+        """
+        Precompute the needle forms used by the in-file content search
+        
+        The last prepared term is kept, so repeating the action with the
+        same term skips the work.
+        
+        Args:
+            search_term: Term entered by the user
+            
+        Returns:
+            Tuple of (needle, needle_bytes, first_bytes): the lowercased
+            term, its ASCII bytes (None for non-ASCII terms) and the upper
+            and lower case forms of its first byte
+        """
+        if self._last_needle is not None and self._last_needle[0] == search_term:
+            return self._last_needle[1]
+        
+        needle = search_term.lower()
+        if needle.isascii():
+            needle_bytes = needle.encode('ascii')
+            first = needle_bytes[:1]
+            first_bytes = tuple({first, first.upper()})
+        else:
+            needle_bytes = first_bytes = None
+        
+        prepared = (needle, needle_bytes, first_bytes)
+        self._last_needle = (search_term, prepared)
+        return prepared
+    
+    def _find_matching_lines(self, file_path, needle_bytes, first_bytes=None):
+        """
+        Find the lines of a file containing a lowercased ASCII needle
+        
+        The file is read in binary blocks and each block is searched with a
+        single bytes.find; a line is only sliced out around a hit. Only the
+        unfinished last line of a block is carried into the next one, so a
+        match can never straddle two blocks. The blocks are also fed through
+        an incremental UTF-8 decoder to tell text files from binary ones.
+        
+        Blocks that do not contain the needle's first byte in either case are
+        skipped without being lowercased.
+        
+        An unfinished line longer than one block is not carried whole: it is
+        searched once, reported as a snippet around its first match, and only
+        its last len(needle) - 1 bytes are kept, so files without newlines
+        are still scanned in linear time.
+        
+        Args:
+            file_path: Path of the file to scan
+            needle_bytes: Lowercased ASCII search term as bytes
+            first_bytes: Case variants of the needle's first byte
+            
+        Returns:
+            Tuple of (is_text, found, lines) where lines holds the stripped
+            matching lines of a UTF-8 text file
+        """
+        if first_bytes is None:
+            first = needle_bytes[:1]
+            first_bytes = (first, first.upper())
+        validate = codecs.getincrementaldecoder('utf-8')().decode
+        is_text = True
+        found = False
+        lines = []
+        carry = b""
+        keep = len(needle_bytes) - 1
+        # Set while inside a line that overflowed the carry; the flag records
+        # whether that line has already been reported
+        long_line = False
+        long_line_reported = False
+        
+        with open(file_path, 'rb') as file:
+            while True:
+                chunk = file.read(self.chunk_size)
+                final = not chunk
+                if is_text:
+                    try:
+                        validate(chunk, final)
+                    except UnicodeDecodeError:
+                        is_text = False
+                if final:
+                    break
+                
+                buffer = carry + chunk
+                # Everything after the last newline may continue in the next block
+                complete = buffer.rfind(b"\n") + 1
+                if any(first in buffer for first in first_bytes):
+                    lowered = buffer.lower()
+                    pos = lowered.find(needle_bytes, 0, complete)
+                    if long_line and long_line_reported and pos != -1 and pos < lowered.find(b"\n"):
+                        # The rest of an overflowed line that was already reported
+                        pos = lowered.find(needle_bytes, lowered.find(b"\n") + 1, complete)
+                    while pos != -1:
+                        found = True
+                        start = lowered.rfind(b"\n", 0, pos) + 1
+                        end = lowered.find(b"\n", pos)
+                        lines.append(buffer[start:end])
+                        pos = lowered.find(needle_bytes, end + 1, complete)
+                if complete:
+                    long_line = long_line_reported = False
+                carry = buffer[complete:]
+                
+                if len(carry) > self.chunk_size:
+                    # Search the overflowing line now and carry only the bytes a
+                    # match straddling the next block could still need
+                    if not long_line_reported:
+                        pos = carry.lower().find(needle_bytes)
+                        if pos != -1:
+                            found = long_line_reported = True
+                            lines.append(carry[max(pos - _SNIPPET_CONTEXT, 0):pos + len(needle_bytes) + _SNIPPET_CONTEXT])
+                    long_line = True
+                    carry = carry[len(carry) - keep:] if keep else b""
+        
+        # The last line has no trailing newline
+        if not long_line_reported and needle_bytes in carry.lower():
+            found = True
+            lines.append(carry)
+        
+        if not is_text:
+            return False, found, []
+        
+        # Split on every line boundary str.splitlines knows, not just "\n";
+        # snippets of overflowed lines may cut a character at either end
+        needle = needle_bytes.decode('ascii')
+        return True, found, [part.strip()
+                             for line in lines
+                             for part in line.decode('utf-8', 'ignore').splitlines()
+                             if needle in part.lower()]
+    
     def _add_to_search_history(self, entry):
         """Add an entry to the search history"""
-        # Limit history size
-        if len(self.search_history) >= self.max_history:
-            self.search_history.pop(0)  # Remove oldest entry
-        
+        # The bounded deque drops the oldest entry when full
         self.search_history.append(entry)
-        self.config_manager.set("search_history", self.search_history)
+        
+        # Appending one line keeps each save O(1); the log is rewritten with
+        # just the retained entries once it holds twice as many as needed
+        if self._history_log_lines >= 2 * self.max_history:
+            self._save_search_history()
+            return
+        try:
+            with open(self._history_path, 'a', encoding='utf-8') as log:
+                log.write(json.dumps(entry, default=str) + "\n")
+            self._history_log_lines += 1
+        except OSError as e:
+            print(f"Error saving search history: {e}")
+    
+    def _save_search_history(self):
+        """Rewrite the history log with the entries currently kept"""
+        try:
+            with open(self._history_path, 'w', encoding='utf-8') as log:
+                log.writelines(json.dumps(entry, default=str) + "\n" for entry in self.search_history)
+            self._history_log_lines = len(self.search_history)
+        except OSError as e:
+            print(f"Error saving search history: {e}")
     
     def _load_search_history(self):
-        """Load search history from config"""
-        history = self.config_manager.get("search_history", [])
-        # Ensure history is a list of dicts
-        if isinstance(history, list):
-            self.search_history = history
+        """Load search history from the history log (or the config, for older installs)"""
+        if not os.path.exists(self._history_path):
+            history = self.config_manager.get("search_history", [])
+            # Ensure history is a list of dicts
+            if isinstance(history, list):
+                self.search_history = deque(history, maxlen=self.max_history)
+            else:
+                self.search_history = deque(maxlen=self.max_history)
+            # The first append writes the whole log, carrying these entries over
+            self._history_log_lines = 2 * self.max_history
+            return
+        
+        history = []
+        try:
+            with open(self._history_path, 'r', encoding='utf-8') as log:
+                for line in log:
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        continue  # Skip a line cut short by an interrupted write
+        except OSError as e:
+            print(f"Error loading search history: {e}")
+        self.search_history = deque(history, maxlen=self.max_history)
+        self._history_log_lines = len(history)
+    
+    def _format_history_timestamp(self, timestamp):
+        """
+        Format a history timestamp for display
+        
+        Args:
+            timestamp: Epoch seconds, or an ISO string from older history entries
+            
+        Returns:
+            Timestamp formatted as YYYY-MM-DD HH:MM:SS
+        """
+        if isinstance(timestamp, str):
+            moment = datetime.datetime.fromisoformat(timestamp)
         else:
-            self.search_history = []
+            moment = datetime.datetime.fromtimestamp(timestamp)
+        return moment.strftime("%Y-%m-%d %H:%M:%S")
     
     def _clear_search_history(self):
         """Clear the search history"""
-        self.search_history = []
-        self.config_manager.set("search_history", self.search_history)
+        self.search_history = deque(maxlen=self.max_history)
+        self._save_search_history()
         print("Search history cleared.")
         print("\nPress Enter to continue...")
         input()
@@ -825,12 +1462,8 @@ class SearchHandler(MenuHandler):
         if self.config_manager.get("max_history") is None:
             self.config_manager.set("max_history", 10)
         
-        if self.config_manager.get("search_history") is None:
-            self.config_manager.set("search_history", [])
-        
-        # Load initial settings
+        # Load initial settings (the history itself is read by _load_search_history)
         self.max_history = self.config_manager.get("max_history")
-        self.search_history = self.config_manager.get("search_history")
     
     def _show_welcome_message(self):
         """Show the welcome message and initial setup instructions"""
@@ -864,28 +1497,22 @@ class SearchHandler(MenuHandler):
         while True:
             # Display the menu
             os.system('cls' if os.name == 'nt' else 'clear')
-            print("=" * 60)
-            print(" Unified Search Menu")
-            print("=" * 60)
-            
-            for i, option in enumerate(self.options, 1):
-                print(f"{i}. {option}")
-            
-            print("0. Exit")
+            print(self._menu_text)
             
             choice = input("Select an option: ").strip()
             
             if choice == '0':
                 print("Thank you for using the Unified Search Tool. Goodbye!")
                 break
-            elif choice in [str(i) for i in range(1, len(self.options) + 1)]:
+            
+            handler_method = self._handlers.get(choice)
+            if handler_method is not None:
                 # Handle the selected option
-                handler_method = getattr(self, f"_handle_option_{choice}")
                 handler_method()
             else:
                 print("Invalid choice. Please try again.")
         
         # Save search history and cleanup
-        self.config_manager.set("search_history", self.search_history)
+        self._save_search_history()
         # Don't try to call save() as it doesn't exist
         print("Search history saved.")
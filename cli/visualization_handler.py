@@ -1,11 +1,78 @@
 """
 Handler for visualization operations
 """
+import hashlib
 import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from operator import itemgetter
 from cli.handler_base import MenuHandler
 from compression.huffman import Encoder
-from storage.red_black_tree import FileIndexManager
-from storage.btree import FileIndexBTree
+
+
+def _count_symbols(file_path, chunk_size=1 << 20):
+    """
+    Count the byte frequencies of a file as Huffman symbols
+    
+    Like Encoder.compress, each byte is one symbol (chr of the byte value).
+    The raw chunks are mapped with a latin-1 decode, a plain copy with no
+    UTF-8 validation, and counted one chunk at a time.
+    
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes read per call
+        
+    Returns:
+        Dictionary mapping each symbol to its count
+    """
+    counts = Counter()
+    with open(file_path, 'rb', buffering=0) as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            counts.update(chunk.decode('latin-1'))
+    return dict(counts)
+
+
+def _analyze_compression(file_path):
+    """
+    Compute the Huffman compression ratio of one file
+    
+    Kept at module level so it can run in a worker process.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Tuple of (result, error): the comparison result dictionary and None,
+        or None and the error message if the file could not be analyzed
+    """
+    try:
+        frequencies = _count_symbols(file_path)
+        
+        # One symbol per byte, so this is the file size in bits
+        original_size = sum(frequencies.values()) * 8
+        
+        temp_encoder = Encoder()
+        huffman_tree = temp_encoder.huffman_tree
+        huffman_tree.build_tree_from_freq(frequencies)
+        # The encoded length is each symbol's code length times its count,
+        # so the bit string itself never needs to be built
+        codes = huffman_tree.codes
+        compressed_size = sum(freq * len(codes[symbol])
+                              for symbol, freq in huffman_tree.freq_dict.items())
+        
+        ratio = round((1 - compressed_size / original_size) * 100, 2)
+        return {
+            'file': os.path.basename(file_path),
+            'path': file_path,
+            'original_size': original_size,
+            'compressed_size': compressed_size,
+            'ratio': ratio
+        }, None
+    except Exception as e:
+        return None, str(e)
+
 
 class VisualizationHandler(MenuHandler):
     """
@@ -22,10 +89,30 @@ class VisualizationHandler(MenuHandler):
             "Compare compression ratios"
         ]
         
-        # Initialize components used for visualization
-        self.encoder = Encoder()
-        self.rb_manager = FileIndexManager()
-        self.btree_manager = FileIndexBTree()
+        # Compression comparison results keyed by (abspath, mtime_ns, size)
+        self._compression_cache = {}
+        # ... and by content digest, so identical files are analyzed once
+        self._ratio_by_digest = {}
+    
+    # Components used for visualization are created on first use, so a
+    # session that only views one structure never builds the others
+    
+    @cached_property
+    def encoder(self):
+        """Huffman encoder for the Huffman tree view"""
+        return Encoder()
+    
+    @cached_property
+    def rb_manager(self):
+        """Red-Black Tree index for the Red-Black Tree view"""
+        from storage.red_black_tree import FileIndexManager
+        return FileIndexManager()
+    
+    @cached_property
+    def btree_manager(self):
+        """B-Tree index for the B-Tree view"""
+        from storage.btree import FileIndexBTree
+        return FileIndexBTree()
     
     def _handle_option_1(self):
         """Handle view Huffman tree option"""
@@ -45,7 +132,8 @@ class VisualizationHandler(MenuHandler):
                 # If text reading fails, try binary mode
                 with open(file_path, 'rb') as file:
                     binary_data = file.read()
-                    text = str(binary_data)  # Convert binary data to string representation
+                    # One character per byte, as Encoder.compress sees the file
+                    text = binary_data.decode('latin-1')
                 print("Note: File appears to be binary. Using binary representation for visualization.")
             
             huffman_tree = self.encoder.huffman_tree
@@ -67,10 +155,8 @@ class VisualizationHandler(MenuHandler):
                     # If it's a directory, append a default filename
                     output_path = os.path.join(output_path, os.path.basename(file_path) + "_huffman_tree.txt")
                 
-                with open(output_path, 'w', encoding='utf-8') as viz_file:
-                    viz_file.write(f"Huffman Tree Visualization for {file_path}\n")
-                    viz_file.write("=" * 50 + "\n")
-                    viz_file.write(tree_visualization)
+                self._write_visualization(output_path, f"Huffman Tree Visualization for {file_path}",
+                                          tree_visualization)
                 
                 print(f"\nTree visualization exported to {output_path}")
             
@@ -102,10 +188,7 @@ class VisualizationHandler(MenuHandler):
                     # If it's a directory, append a default filename
                     output_path = os.path.join(output_path, "rbtree_visualization.txt")
                 
-                with open(output_path, 'w', encoding='utf-8') as viz_file:
-                    viz_file.write("Red-Black Tree Visualization\n")
-                    viz_file.write("=" * 50 + "\n")
-                    viz_file.write(tree_visualization)
+                self._write_visualization(output_path, "Red-Black Tree Visualization", tree_visualization)
                 
                 print(f"\nTree visualization exported to {output_path}")
             except Exception as e:
@@ -165,10 +248,7 @@ class VisualizationHandler(MenuHandler):
                     # If it's a directory, append a default filename
                     output_path = os.path.join(output_path, "btree_visualization.txt")
                 
-                with open(output_path, 'w', encoding='utf-8') as viz_file:
-                    viz_file.write("B-Tree Visualization\n")
-                    viz_file.write("=" * 50 + "\n")
-                    viz_file.write(tree_visualization)
+                self._write_visualization(output_path, "B-Tree Visualization", tree_visualization)
                 
                 print(f"\nTree visualization exported to {output_path}")
             except Exception as e:
@@ -180,35 +260,19 @@ class VisualizationHandler(MenuHandler):
         print("==================================")
         
         # Get list of files to compare
-        file_paths = self._get_multiple_file_paths()
-        if not file_paths:
+        entries = self._get_multiple_file_paths()
+        if not entries:
             return
+        file_paths = [file_path for file_path, _ in entries]
         
-        # Analyze each file
+        # Analyze each file, reusing the stat results from input validation
         results = []
-        for file_path in file_paths:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    text = file.read()
-                
-                original_size = len(text) * 8  # Assuming 8 bits per character
-                
-                temp_encoder = Encoder()
-                temp_encoder.huffman_tree.build_tree(text)
-                encoded_text = temp_encoder.huffman_tree._get_encoded_text(text)
-                compressed_size = len(encoded_text)
-                
-                ratio = round((1 - compressed_size / original_size) * 100, 2)
-                results.append({
-                    'file': os.path.basename(file_path),
-                    'path': file_path,
-                    'original_size': original_size,
-                    'compressed_size': compressed_size,
-                    'ratio': ratio
-                })
-            
-            except Exception as e:
-                print(f"Error analyzing {file_path}: {str(e)}")
+        outcomes = self._analyze_files(file_paths, [stats for _, stats in entries])
+        for file_path, (result, error) in zip(file_paths, outcomes):
+            if error is not None:
+                print(f"Error analyzing {file_path}: {error}")
+            else:
+                results.append(result)
         
         # Display results
         if not results:
@@ -216,7 +280,7 @@ class VisualizationHandler(MenuHandler):
             return
         
         # Sort by compression ratio (descending)
-        sorted_results = sorted(results, key=lambda x: x['ratio'], reverse=True)
+        sorted_results = sorted(results, key=itemgetter('ratio'), reverse=True)
         
         # Display the comparison table
         self._display_comparison_table(sorted_results)
@@ -234,20 +298,147 @@ class VisualizationHandler(MenuHandler):
                     comp_file.write("=" * 70 + "\n")
                     comp_file.write(f"{'Filename':<30} {'Original Size':<15} {'Compressed Size':<15} {'Ratio':<10}\n")
                     comp_file.write("-" * 70 + "\n")
-                    
-                    for result in sorted_results:
-                        comp_file.write(f"{result['file']:<30} {result['original_size']:<15} {result['compressed_size']:<15} {result['ratio']}%\n")
+                    comp_file.writelines(row + "\n" for row in self._comparison_rows(sorted_results))
                 
                 print(f"\nComparison exported to {output_path}")
             except Exception as e:
                 self._display_error_message(f"Error exporting comparison: {str(e)}")
     
+    def _analyze_files(self, file_paths, file_stats=None):
+        """
+        Analyze several files for the compression comparison
+        
+        Files analyzed before and unchanged since (same modification time
+        and size) reuse the cached result, as do files whose content matches
+        an analyzed file. Building the Huffman trees is CPU-bound Python, so
+        the remaining files are spread over worker processes rather than
+        threads.
+        
+        Args:
+            file_paths: List of file paths to analyze
+            file_stats: Optional os.stat results for file_paths, in order
+            
+        Returns:
+            List of (result, error) tuples in the same order as file_paths
+        """
+        outcomes = [None] * len(file_paths)
+        keys = [None] * len(file_paths)
+        pending = []
+        for i, file_path in enumerate(file_paths):
+            try:
+                stats = file_stats[i] if file_stats else os.stat(file_path)
+                keys[i] = (os.path.abspath(file_path), stats.st_mtime_ns, stats.st_size)
+            except OSError:
+                pass  # Let the analysis report the error
+            cached = self._compression_cache.get(keys[i]) if keys[i] else None
+            if cached is not None:
+                outcomes[i] = (dict(cached, file=os.path.basename(file_path), path=file_path), None)
+            else:
+                pending.append(i)
+        
+        # Group the remaining files by content so duplicates share one analysis
+        groups = {}
+        for i in pending:
+            digest = self._content_digest(file_paths[i])
+            known = self._ratio_by_digest.get(digest) if digest else None
+            if known is not None:
+                outcomes[i] = (dict(known, file=os.path.basename(file_paths[i]), path=file_paths[i]), None)
+                if keys[i] is not None:
+                    self._compression_cache[keys[i]] = outcomes[i][0]
+            else:
+                groups.setdefault(digest or i, []).append(i)
+        
+        leaders = [file_paths[members[0]] for members in groups.values()]
+        for (group, members), (result, error) in zip(groups.items(), self._run_analysis(leaders)):
+            if error is None and isinstance(group, bytes):
+                self._ratio_by_digest[group] = result
+            for i in members:
+                if error is not None:
+                    outcomes[i] = (None, error)
+                    continue
+                outcomes[i] = (dict(result, file=os.path.basename(file_paths[i]), path=file_paths[i]), None)
+                if keys[i] is not None:
+                    self._compression_cache[keys[i]] = outcomes[i][0]
+        
+        return outcomes
+    
+    def _content_digest(self, file_path, chunk_size=1 << 20):
+        """
+        Fingerprint a file's content for the compression comparison
+        
+        Hashing runs at memory speed, far faster than counting characters,
+        so it is cheap to check for duplicates before analyzing.
+        
+        Args:
+            file_path: Path of the file to hash
+            chunk_size: Number of bytes hashed per read
+            
+        Returns:
+            BLAKE2b digest as bytes, or None if the file cannot be read
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(file_path, 'rb') as file:
+                for chunk in iter(lambda: file.read(chunk_size), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.digest()
+    
+    def _run_analysis(self, file_paths):
+        """
+        Run _analyze_compression over files, in worker processes if several
+        
+        Args:
+            file_paths: List of file paths to analyze
+            
+        Returns:
+            List of (result, error) tuples in the same order as file_paths
+        """
+        if len(file_paths) < 2:
+            return [_analyze_compression(file_path) for file_path in file_paths]
+        
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(_analyze_compression, file_paths))
+        except (OSError, NotImplementedError):
+            # No process support on this platform; analyze in this process
+            return [_analyze_compression(file_path) for file_path in file_paths]
+    
+    def _write_visualization(self, output_path, title, tree_visualization):
+        """
+        Write a tree visualization export in a single write
+        
+        The file is left untouched if it already holds exactly this export.
+        
+        Args:
+            output_path: Path of the export file
+            title: Title line written above the visualization
+            tree_visualization: Text visualization of the tree
+        """
+        payload = f"{title}\n{'=' * 50}\n{tree_visualization}"
+        if os.linesep != "\n":
+            payload = payload.replace("\n", os.linesep)  # What text mode would write
+        data = payload.encode('utf-8')
+        
+        try:
+            if os.path.getsize(output_path) == len(data):
+                with open(output_path, 'rb') as existing:
+                    if existing.read() == data:
+                        return
+        except OSError:
+            pass  # No previous export to compare against
+        
+        with open(output_path, 'wb') as viz_file:
+            viz_file.write(data)
+    
     def _get_multiple_file_paths(self):
         """
         Get multiple file paths from user input
         
         Returns:
-            List of valid file paths
+            List of (file path, os.stat result) tuples for the valid paths
         """
         file_paths = []
         print("Enter file paths to analyze (leave blank to finish):")
@@ -257,9 +448,10 @@ class VisualizationHandler(MenuHandler):
             if not file_path:
                 break
             
-            if os.path.exists(file_path):
-                file_paths.append(file_path)
-            else:
+            # Keep the stat result so the analysis does not stat again
+            try:
+                file_paths.append((file_path, os.stat(file_path)))
+            except OSError:
                 print(f"Error: File {file_path} does not exist. Skipping.")
         
         if not file_paths:
@@ -279,8 +471,23 @@ class VisualizationHandler(MenuHandler):
         print(f"{'Filename':<30} {'Original Size':<15} {'Compressed Size':<15} {'Ratio':<10}")
         print("-" * 70)
         
-        for result in results:
-            print(f"{result['file']:<30} {result['original_size']:<15} {result['compressed_size']:<15} {result['ratio']}%")
+        # Emit the whole table in one write instead of one print per row
+        rows = self._comparison_rows(results)
+        if rows:
+            sys.stdout.write("\n".join(rows) + "\n")
+    
+    def _comparison_rows(self, results):
+        """
+        Format compression results as comparison table rows
+        
+        Args:
+            results: List of compression results
+            
+        Returns:
+            List of formatted rows without line endings
+        """
+        return [f"{result['file']:<30} {result['original_size']:<15} {result['compressed_size']:<15} {result['ratio']}%"
+                for result in results]
     
     def _validate_file_exists(self, file_path):
         """
@@ -2,28 +2,25 @@
 Huffman coding implementation for text file compression
 """
 import heapq
+import mmap
 import os
+import struct
 from collections import Counter
+from itertools import chain
+from operator import itemgetter
+
+# Longest code length; bounds the decoder lookup table at 2**15 entries
+MAX_CODE_LENGTH = 15
 
-# We need to create a custom Node class that's comparable for the priority queue
 class Node:
     """Node class for Huffman Tree"""
+    __slots__ = ('freq', 'symbol', 'left', 'right')
+    
     def __init__(self, freq, symbol, left=None, right=None):
         self.freq = freq
         self.symbol = symbol
         self.left = left
         self.right = right
-        self.huff = ''
-        
-    def __lt__(self, other):
-        """Less than comparison for priority queue"""
-        return self.freq < other.freq
-    
-    def __eq__(self, other):
-        """Equal comparison for priority queue"""
-        if other is None:
-            return False
-        return self.freq == other.freq
 
 class HuffmanTree:
     """
@@ -31,7 +28,8 @@ class HuffmanTree:
     """
     def __init__(self):
         self.codes = {}
-        self.reverse_mapping = {}
+        self.bit_codes = {}
+        self.code_lengths = {}
         self.root = None
         self.freq_dict = None
 
@@ -44,11 +42,12 @@ class HuffmanTree:
     def _make_heap(self, frequency):
         """
         Create a priority queue from frequency dictionary
+
+        Entries are (freq, order, node) tuples: the unique order breaks
+        ties, so heap comparisons never reach the nodes themselves.
         """
-        heap = []
-        for symbol, freq in frequency.items():
-            node = Node(freq, symbol)
-            heapq.heappush(heap, node)
+        heap = [(freq, order, Node(freq, symbol)) for order, (symbol, freq) in enumerate(frequency.items())]
+        heapq.heapify(heap)
         return heap
     
     def _merge_nodes(self, heap):
@@ -57,104 +56,224 @@ class HuffmanTree:
         """
         if len(heap) == 1:
             # Special case: Only one unique character in text
-            symbol = heap[0].symbol
-            new_node = Node(
-                freq=heap[0].freq, 
+            freq, _, node = heap[0]
+            return Node(
+                freq=freq, 
                 symbol=None, 
-                left=Node(freq=0, symbol=symbol),
+                left=Node(freq=0, symbol=node.symbol),
                 right=Node(freq=0, symbol=None)
             )
-            heapq.heappush(heap, new_node)
-            heapq.heappop(heap)
-            
+        
+        order = len(heap)
         while len(heap) > 1:
-            node1 = heapq.heappop(heap)
-            node2 = heapq.heappop(heap)
+            freq1, _, node1 = heapq.heappop(heap)
+            freq2, _, node2 = heap[0]
             
-            merged = Node(freq=node1.freq + node2.freq, symbol=None, left=node1, right=node2)
-            heapq.heappush(heap, merged)
+            merged = Node(freq=freq1 + freq2, symbol=None, left=node1, right=node2)
+            heapq.heapreplace(heap, (merged.freq, order, merged))
+            order += 1
         
-        return heap[0]
+        return heap[0][2]
     
-    def _make_codes_helper(self, root, current_code):
+    def _make_code_lengths(self):
         """
-        Helper function to create codes recursively
+        Walk the tree iteratively and return the code length of each symbol
         """
-        if root is None:
-            return
-        
-        if root.symbol is not None:
-            self.codes[root.symbol] = current_code
-            self.reverse_mapping[current_code] = root.symbol
-            return
-        
-        self._make_codes_helper(root.left, current_code + "0")
-        self._make_codes_helper(root.right, current_code + "1")
+        code_lengths = {}
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                continue
+            if node.symbol is not None:
+                code_lengths[node.symbol] = depth
+            else:
+                stack.append((node.right, depth + 1))
+                stack.append((node.left, depth + 1))
+        return code_lengths
     
-    def _make_codes(self):
+    def _assign_canonical_codes(self, code_lengths):
         """
-        Create Huffman codes for each symbol
+        Assign canonical Huffman codes from code lengths
+
+        Symbols are ordered by (length, symbol) and given consecutive
+        integers, shifted left whenever the length grows. The codes depend
+        only on the lengths, so a decoder can rebuild them without the tree.
         """
-        self._make_codes_helper(self.root, "")
+        self.code_lengths = code_lengths
+        self.codes = {}
+        self.bit_codes = {}
+        code = 0
+        prev_length = 0
+        for symbol, length in sorted(code_lengths.items(), key=lambda item: (item[1], item[0])):
+            code <<= length - prev_length
+            self.bit_codes[symbol] = (code, length)
+            self.codes[symbol] = format(code, f'0{length}b')
+            code += 1
+            prev_length = length
     
-    def _get_encoded_text(self, text):
+    def _limit_code_lengths(self, max_length):
         """
-        Encode the input text using generated Huffman codes
-        """
-        encoded_text = ""
-        for character in text:
-            encoded_text += self.codes[character]
-        return encoded_text
+        Compute code lengths of at most max_length bits with Package-Merge
+
+        Leaves are sorted by frequency. At each of the max_length - 1
+        levels, adjacent items are paired into packages and merged back
+        with the leaves. A symbol's code length is the number of times it
+        appears in the first 2n - 2 items of the final list.
+        """
+        symbols = list(self.freq_dict)
+        leaves = sorted((freq, (index,)) for index, freq in enumerate(self.freq_dict.values()))
+        items = leaves
+        for _ in range(max_length - 1):
+            packages = [(items[i][0] + items[i + 1][0], items[i][1] + items[i + 1][1])
+                        for i in range(0, len(items) - 1, 2)]
+            items = list(heapq.merge(leaves, packages, key=itemgetter(0)))
+        
+        lengths = [0] * len(symbols)
+        for _, members in items[:2 * len(symbols) - 2]:
+            for index in members:
+                lengths[index] += 1
+        return dict(zip(symbols, lengths))
     
-    def _pad_encoded_text(self, encoded_text):
+    def _make_codes(self):
         """
-        Pad the encoded text to make it a multiple of 8 bits
+        Create Huffman codes for each symbol
         """
-        extra_padding = 8 - len(encoded_text) % 8
-        for _ in range(extra_padding):
-            encoded_text += "0"
-        
-        # Add information about padding at the beginning
-        padded_info = format(extra_padding, '08b')
-        encoded_text = padded_info + encoded_text
-        return encoded_text
+        code_lengths = self._make_code_lengths()
+        if (max(code_lengths.values()) > MAX_CODE_LENGTH
+                and len(code_lengths) <= 1 << MAX_CODE_LENGTH):
+            code_lengths = self._limit_code_lengths(MAX_CODE_LENGTH)
+        self._assign_canonical_codes(code_lengths)
     
-    def _get_byte_array(self, padded_encoded_text):
-        """
-        Convert the padded encoded text to bytes
+    def _encode_bytes(self, data):
         """
-        b = bytearray()
-        for i in range(0, len(padded_encoded_text), 8):
-            byte = padded_encoded_text[i:i+8]
-            b.append(int(byte, 2))
-        return bytes(b)
+        Encode, pad and pack the input bytes in a single pass
+
+        Codes are shifted into an integer accumulator that is flushed
+        eight bytes at a time, so no bit string or other full-size
+        intermediate is built. The first output byte holds the number of
+        padding bits at the end.
+        """
+        table = [self.bit_codes.get(b) for b in range(256)]
+        out = bytearray(1)
+        acc = 0
+        nbits = 0
+        for b in data:
+            code, length = table[b]
+            acc = (acc << length) | code
+            nbits += length
+            if nbits >= 64:
+                nbits -= 64
+                out += (acc >> nbits).to_bytes(8, 'big')
+                acc &= (1 << nbits) - 1
+        
+        # Flush whole bytes left over, then the padded final byte
+        nbytes = nbits // 8
+        if nbytes:
+            nbits -= nbytes * 8
+            out += (acc >> nbits).to_bytes(nbytes, 'big')
+            acc &= (1 << nbits) - 1
+        extra_padding = 8 - nbits
+        out.append((acc << extra_padding) & 0xFF)
+        out[0] = extra_padding
+        return bytes(out)
     
-    def _remove_padding(self, padded_encoded_text):
+    def _build_decode_table(self):
         """
-        Remove padding from the encoded text
+        Build a lookup table indexed by the next max_code_length bits
+
+        Every index whose leading bits match a code maps to that code's
+        (symbol, length), so a single lookup decodes one symbol.
+        """
+        max_len = max(length for _, length in self.bit_codes.values())
+        table = [None] * (1 << max_len)
+        for symbol, (code, length) in self.bit_codes.items():
+            shift = max_len - length
+            start = code << shift
+            table[start:start + (1 << shift)] = [(symbol, length)] * (1 << shift)
+        return table, max_len
+    
+    def _decode_bytes(self, data):
         """
-        padded_info = padded_encoded_text[:8]
-        extra_padding = int(padded_info, 2)
-        
-        padded_encoded_text = padded_encoded_text[8:]
-        encoded_text = padded_encoded_text[:-extra_padding] if extra_padding > 0 else padded_encoded_text
-        
-        return encoded_text
+        Decode packed bytes produced by _encode_bytes
+
+        The first byte holds the number of padding bits at the end. Bits are
+        fed into an integer accumulator 64 at a time and decoded
+        max_code_length bits at a time through the lookup table.
+        """
+        extra_padding = data[0]
+        table, max_len = self._build_decode_table()
+        mask = (1 << max_len) - 1
+        decoded = bytearray()
+        acc = 0
+        nbits = 0
+        # Whole 64-bit words first, then the leftover bytes one at a time
+        body = memoryview(data)[1:-1]
+        split = len(body) - len(body) % 8
+        chunks = chain(((word, 64) for (word,) in struct.iter_unpack('>Q', body[:split])),
+                       ((byte, 8) for byte in body[split:]))
+        for chunk, width in chunks:
+            acc = (acc << width) | chunk
+            nbits += width
+            while nbits >= max_len:
+                symbol, length = table[(acc >> (nbits - max_len)) & mask]
+                decoded.append(symbol)
+                nbits -= length
+            acc &= (1 << nbits) - 1
+        
+        # Tail: drop the padding, then look up the remaining bits left-aligned
+        acc = ((acc << 8) | data[-1]) >> extra_padding
+        nbits += 8 - extra_padding
+        while nbits > 0:
+            if nbits >= max_len:
+                index = (acc >> (nbits - max_len)) & mask
+            else:
+                index = (acc << (max_len - nbits)) & mask
+            entry = table[index]
+            if entry is None or entry[1] > nbits:
+                break
+            decoded.append(entry[0])
+            nbits -= entry[1]
+            acc &= (1 << nbits) - 1
+        
+        return decoded
     
-    def _decode_text(self, encoded_text):
+    def _write_code_lengths(self, file):
         """
-        Decode text using reverse mapping of codes
+        Write the codebook header: one code-length byte per byte value
+
+        Canonical codes are fully determined by these lengths, so the
+        decoder needs no frequency table and no tree.
         """
-        current_code = ""
-        decoded_text = ""
-        
-        for bit in encoded_text:
-            current_code += bit
-            if current_code in self.reverse_mapping:
-                decoded_text += self.reverse_mapping[current_code]
-                current_code = ""
-        
-        return decoded_text
+        file.write(bytes(self.code_lengths.get(b, 0) for b in range(256)))
+    
+    @staticmethod
+    def _read_code_lengths(file):
+        """
+        Read and validate the header written by _write_code_lengths
+
+        Returns:
+            dict mapping each byte value present in the data to its code length
+
+        Raises:
+            ValueError: If the header is truncated or the lengths do not
+                form a valid prefix code
+        """
+        header = file.read(256)
+        if len(header) != 256:
+            raise ValueError("Not a Huffman compressed file: header is truncated")
+        code_lengths = {b: length for b, length in enumerate(header) if length}
+        if not code_lengths:
+            raise ValueError("Not a Huffman compressed file: header has no symbols")
+        
+        # Kraft inequality: the lengths must leave room for a prefix code
+        max_len = max(code_lengths.values())
+        if max_len > MAX_CODE_LENGTH:
+            raise ValueError("Not a Huffman compressed file: code length exceeds "
+                             f"{MAX_CODE_LENGTH} bits")
+        if sum(1 << (max_len - length) for length in code_lengths.values()) > 1 << max_len:
+            raise ValueError("Not a Huffman compressed file: invalid code lengths")
+        return code_lengths
     
     def build_tree(self, text):
         """
@@ -182,21 +301,25 @@ class HuffmanTree:
             return "Tree not built yet"
         
         lines = []
-        
-        def _print_tree(node, prefix="", is_left=True):
+        # Explicit stack of (node, prefix, is_left); right is pushed first
+        # so the left subtree is printed first, as in a pre-order walk
+        stack = [(self.root, "", True)]
+        while stack:
+            node, prefix, is_left = stack.pop()
             if node is None:
-                return
+                continue
             
             if node.symbol is not None:
-                lines.append(f"{prefix}{'└── ' if is_left else '┌── '}{node.symbol} ({node.freq})")
+                # Byte-valued symbols are shown as their character
+                symbol = chr(node.symbol) if isinstance(node.symbol, int) else node.symbol
+                lines.append(f"{prefix}{'└── ' if is_left else '┌── '}{symbol} ({node.freq})")
             else:
                 lines.append(f"{prefix}{'└── ' if is_left else '┌── '}Internal ({node.freq})")
             
             new_prefix = prefix + ("    " if is_left else "│   ")
-            _print_tree(node.left, new_prefix, True)
-            _print_tree(node.right, new_prefix, False)
+            stack.append((node.right, new_prefix, False))
+            stack.append((node.left, new_prefix, True))
         
-        _print_tree(self.root, "", True)
         return "\n".join(lines)
 
 class Encoder:
@@ -215,32 +338,23 @@ class Encoder:
         if not output_path:
             output_path = input_path + ".bin"
         
-        # Read file as binary to handle all file types
-        with open(input_path, 'rb') as file:
-            content = file.read()
-            
-        # Convert bytes to string for processing
-        text = ''.join(chr(b) for b in content)
-        
-        self.original_size = len(content)
-        
-        # Build Huffman tree
-        self.huffman_tree.build_tree(text)
-        
-        # Get encoded text
-        encoded_text = self.huffman_tree._get_encoded_text(text)
-        
-        # Pad encoded text
-        padded_text = self.huffman_tree._pad_encoded_text(encoded_text)
+        self.original_size = os.path.getsize(input_path)
         
-        # Convert to bytes
-        bytes_array = self.huffman_tree._get_byte_array(padded_text)
+        # Read file as binary to handle all file types; symbols are byte values
+        with open(input_path, 'rb') as file:
+            if self.original_size:
+                # Map the file rather than reading a full copy into memory
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as content:
+                    bytes_array = self._encode_content(content)
+            else:
+                # Empty files cannot be mapped
+                bytes_array = self._encode_content(file.read())
         
         # Write to output file
         with open(output_path, 'wb') as output_file:
-            # Store frequency dictionary for decompression
-            import pickle
-            pickle.dump(self.huffman_tree.freq_dict, output_file)
+            # Store code lengths for decompression
+            self.huffman_tree._write_code_lengths(output_file)
             
             # Write the bytes
             output_file.write(bytes_array)
@@ -248,6 +362,19 @@ class Encoder:
         self.compressed_size = os.path.getsize(output_path)
         return output_path
     
+    def _encode_content(self, content):
+        """
+        Build the Huffman tree for content and return the packed encoding
+        """
+        # Build Huffman tree, unless the current one was built from the
+        # same frequencies (e.g. compressing the same file again)
+        frequencies = self.huffman_tree._make_frequency_dict(content)
+        if not self.huffman_tree.codes or frequencies != self.huffman_tree.freq_dict:
+            self.huffman_tree.build_tree_from_freq(frequencies)
+        
+        # Encode, pad and pack in a single pass
+        return self.huffman_tree._encode_bytes(content)
+    
     def get_compression_ratio(self):
         """
         Return the compression ratio achieved
@@ -287,17 +414,18 @@ class Encoder:
         """
         Analyze a file to generate frequency data and build a Huffman tree.
         This method is required for visualization.
+        
+        Returns:
+            Counter mapping each character to its count
         """
         try:
             # Read the file and determine character frequencies
-            analyzer = Analyzer()
-            analysis = analyzer.analyze_file(file_path)
-            frequencies = {char: data['count'] for char, data in analysis['frequencies'].items()}
+            frequencies = Analyzer()._raw_counts(file_path)
             
             # Build Huffman tree based on frequencies
             self.huffman_tree.build_tree_from_freq(frequencies)
             
-            return analysis
+            return frequencies
         except Exception as e:
             import traceback
             print(f"Error analyzing file: {str(e)}")
@@ -332,32 +460,21 @@ class Decoder:
             output_path = filename + "_decompressed.txt"
         
         with open(input_path, 'rb') as file:
-            # Read the frequency dictionary
-            import pickle
-            freq_dict = pickle.load(file)
+            # Read the code lengths
+            code_lengths = self.huffman_tree._read_code_lengths(file)
             
-            # Read the rest as bytes
-            bit_string = ""
-            byte = file.read(1)
-            while byte:
-                byte_val = ord(byte)
-                bits = bin(byte_val)[2:].rjust(8, '0')
-                bit_string += bits
-                byte = file.read(1)
+            # Read the rest of the packed bit stream in one call
+            data = file.read()
         
-        # Rebuild the Huffman tree
-        self.huffman_tree.build_tree_from_freq(freq_dict)
+        # Rebuild the canonical codes; no tree is needed
+        self.huffman_tree._assign_canonical_codes(code_lengths)
         
-        # Remove padding
-        encoded_text = self.huffman_tree._remove_padding(bit_string)
+        # Decode the packed bit stream
+        decompressed = self.huffman_tree._decode_bytes(data)
         
-        # Decode text
-        decompressed_text = self.huffman_tree._decode_text(encoded_text)
-        
-        # Write to output file - convert characters back to bytes
+        # Write to output file
         with open(output_path, 'wb') as file:
-            bytes_content = bytes([ord(c) for c in decompressed_text])
-            file.write(bytes_content)
+            file.write(decompressed)
         
         return output_path
 
@@ -365,24 +482,35 @@ class Analyzer:
     """
     Analyzer for analyzing text files for compression
     """
-    def analyze_file(self, file_path):
+    def _raw_counts(self, file_path):
         """
-        Analyze a file and return character frequencies
+        Count the characters of a file without building the per-character report
         Works with both text and binary files
+        
+        Returns:
+            Counter mapping each character to its count
         """
         try:
             # First try to read as text
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
                 text = file.read()
         except UnicodeDecodeError:
-            # If that fails, read as binary
+            # If that fails, count the raw bytes
             with open(file_path, 'rb') as file:
-                content = file.read()
-                # Convert bytes to a representation suitable for visualization
-                text = ''.join(chr(b) if b < 128 else f'\\x{b:02x}' for b in content)
+                byte_counts = Counter(file.read())
+            # Key each byte by a representation suitable for visualization
+            return Counter({chr(b) if b < 128 else f'\\x{b:02x}': count
+                            for b, count in byte_counts.items()})
         
-        frequencies = Counter(text)
-        total_chars = len(text)
+        return Counter(text)
+    
+    def analyze_file(self, file_path):
+        """
+        Analyze a file and return character frequencies
+        Works with both text and binary files
+        """
+        frequencies = self._raw_counts(file_path)
+        total_chars = sum(frequencies.values())
         
         analysis = {
             'total_characters': total_chars,
@@ -401,10 +529,8 @@ class HuffmanEncoder(Encoder):
         return self.compress(input_path, output_path)
         
     def analyze_frequency(self, file_path):
-        """Analyze frequencies from a file"""
-        analyzer = Analyzer()
-        analysis = analyzer.analyze_file(file_path)
-        return analysis['frequencies']
+        """Analyze frequencies from a file, returning the count of each character"""
+        return Analyzer()._raw_counts(file_path)
 
 class HuffmanDecoder(Decoder):
     """Alias for Decoder class for test compatibility"""
@@ -1,16 +1,29 @@
 import sys
 import os
+import re
+import time
+import random
+import shutil
+import fnmatch
+import multiprocessing
+import statistics
+import tempfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, 
                             QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                             QFileDialog, QMessageBox, QProgressBar, QSplitter,
-                            QStatusBar, QTextEdit, QLineEdit, QCheckBox, QSpinBox, QListWidget, QGroupBox)
-from PyQt5.QtCore import Qt
+                            QStatusBar, QTextEdit, QLineEdit, QCheckBox, QSpinBox, QListWidget, 
+                            QListWidgetItem, QGroupBox)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon, QFont
 
 # Import existing functionality
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from compression.huffman import Encoder, Decoder
+from compression.huffman import Encoder, Decoder, HuffmanEncoder
 from storage.red_black_tree import RedBlackTree
 from storage.btree import BTree
 from utils.config_manager import ConfigManager
@@ -20,20 +33,51 @@ from gui.other_tabs import CompressionTab
 from gui.visualization_tab import VisualizationTab
 
 # File managers might need to be imported or created based on actual implementation
+class FileRecord:
+    """Metadata of one indexed file"""
+    __slots__ = ('path', 'size', 'compressed', 'categories')
+    
+    def __init__(self, path, size=0, compressed=False, categories=None):
+        self.path = path
+        self.size = size
+        self.compressed = compressed
+        self.categories = categories or []
+
+
+class FileMetaStore:
+    """File metadata shared by the index managers, stored once per file"""
+    def __init__(self):
+        self.files = {}
+    
+    def add(self, filename, filepath, size=0, is_compressed=False, categories=None):
+        """Add or update the metadata of a file and return its record"""
+        file_info = self.files.get(filename)
+        if file_info is None:
+            file_info = self.files[filename] = FileRecord(filepath, size, is_compressed, categories)
+        else:
+            # Update in place so managers holding this record see the new values
+            file_info.path = filepath
+            file_info.size = size
+            file_info.compressed = is_compressed
+            file_info.categories = categories or []
+        return file_info
+
+
 class FileIndexManager:
     """Simple manager for Red-Black Tree file indexing"""
-    def __init__(self):
+    def __init__(self, meta_store=None):
         self.rbtree = RedBlackTree()
+        self.meta_store = meta_store if meta_store is not None else FileMetaStore()
         self.files = {}
     
     def add_file(self, filename, filepath, size=0, is_compressed=False, categories=None):
         """Add a file to the Red-Black Tree index"""
-        self.files[filename] = {
-            'path': filepath,
-            'size': size,
-            'compressed': is_compressed,
-            'categories': categories or []
-        }
+        self.meta_store.add(filename, filepath, size, is_compressed, categories)
+        self.index(filename)
+        
+    def index(self, filename):
+        """Index a file whose metadata is already in the shared store"""
+        self.files[filename] = self.meta_store.files[filename]
         self.rbtree.insert(filename)
         
     def get_tree_visualization(self):
@@ -46,15 +90,16 @@ class FileIndexManager:
             return self.rbtree.visualize()
         
         # Basic visualization if the tree doesn't have a built-in method
-        result = "Red-Black Tree Visualization:\n"
-        result += "=" * 40 + "\n"
-        for i, filename in enumerate(sorted(self.files.keys())):
-            result += f"Node {i}: {filename} " + ("(RED)" if i % 2 == 0 else "(BLACK)") + "\n"
+        parts = ["Red-Black Tree Visualization:", "=" * 40]
+        # Sort once; parents are looked up by position in the same list
+        keys = sorted(self.files)
+        for i, filename in enumerate(keys):
+            parts.append(f"Node {i}: {filename} " + ("(RED)" if i % 2 == 0 else "(BLACK)"))
             if i > 0:
-                parent = sorted(self.files.keys())[i//2]
-                result += f"{parent} -> {filename}\n"
+                parent = keys[i//2]
+                parts.append(f"{parent} -> {filename}")
         
-        return result
+        return "\n".join(parts) + "\n"
     
     def search(self, filename):
         """Search for a file in the Red-Black Tree"""
@@ -65,22 +110,27 @@ class FileIndexManager:
     def list_all_files(self):
         """List all files in the index"""
         return list(self.files.keys())
+    
+    def iter_files(self):
+        """Iterate over (filename, file_info) pairs in the index"""
+        return self.files.items()
 
 
 class FileIndexBTree:
     """Simple manager for B-Tree file indexing"""
-    def __init__(self, order=5):
+    def __init__(self, order=5, meta_store=None):
         self.btree = BTree(order)
+        self.meta_store = meta_store if meta_store is not None else FileMetaStore()
         self.files = {}
     
     def add_file(self, filename, filepath, size=0, is_compressed=False, categories=None):
         """Add a file to the B-Tree index"""
-        file_info = {
-            'path': filepath,
-            'size': size,
-            'compressed': is_compressed,
-            'categories': categories or []
-        }
+        self.meta_store.add(filename, filepath, size, is_compressed, categories)
+        self.index(filename)
+        
+    def index(self, filename):
+        """Index a file whose metadata is already in the shared store"""
+        file_info = self.meta_store.files[filename]
         self.files[filename] = file_info
         # Fix: Pass both key and value to the B-Tree insert method
         self.btree.insert(filename, file_info)
@@ -95,19 +145,19 @@ class FileIndexBTree:
             return self.btree.visualize()
         
         # Basic visualization if the tree doesn't have a built-in method
-        result = "B-Tree Visualization:\n"
-        result += "=" * 40 + "\n"
+        parts = ["B-Tree Visualization:", "=" * 40]
         
         # Create a simple representation
-        result += "Node [Root]\n"
-        result += "Keys: " + ", ".join(sorted(self.files.keys())[:3]) + "\n"
+        parts.append("Node [Root]")
+        keys = sorted(self.files)
+        parts.append("Keys: " + ", ".join(keys[:3]))
         
-        for i, filename in enumerate(sorted(self.files.keys())[3:]):
-            result += f"Node [{i+1}]\n"
-            result += f"Keys: {filename}\n"
-            result += f"Child: Node [{i+1}]\n"
+        for i, filename in enumerate(keys[3:]):
+            parts.append(f"Node [{i+1}]")
+            parts.append(f"Keys: {filename}")
+            parts.append(f"Child: Node [{i+1}]")
         
-        return result
+        return "\n".join(parts) + "\n"
     
     def search(self, filename):
         """Search for a file in the B-Tree"""
@@ -118,6 +168,10 @@ class FileIndexBTree:
     def list_all_files(self):
         """List all files in the index"""
         return list(self.files.keys())
+    
+    def iter_files(self):
+        """Iterate over (filename, file_info) pairs in the index"""
+        return self.files.items()
 
 
 class RBTreeTab(QWidget):
@@ -182,7 +236,7 @@ class RBTreeTab(QWidget):
         """Search for a file in the Red-Black Tree"""
         # In a full implementation, you'd have a dialog to enter a filename
         # For simplicity, we'll just search for the first file in the tree
-        files = self.rb_manager.list_all_files()
+        files = self.rb_manager.iter_files()
         
         if not files:
             self.results_text.append("Red-Black Tree is empty.")
@@ -190,9 +244,8 @@ class RBTreeTab(QWidget):
             
         # For demo purposes, just show all files
         self.results_text.append("Files in Red-Black Tree:")
-        for filename in files:
-            file_info = self.rb_manager.search(filename)
-            self.results_text.append(f"- {filename}: {file_info['path']}")
+        for filename, file_info in files:
+            self.results_text.append(f"- {filename}: {file_info.path}")
         
     def list_all_rbtree_files(self):
         """List all files in the Red-Black Tree"""
@@ -269,7 +322,7 @@ class BTreeTab(QWidget):
         """Search for a file in the B-Tree"""
         # In a full implementation, you'd have a dialog to enter a filename
         # For simplicity, we'll just search for the first file in the tree
-        files = self.btree_manager.list_all_files()
+        files = self.btree_manager.iter_files()
         
         if not files:
             self.results_text.append("B-Tree is empty.")
@@ -277,9 +330,8 @@ class BTreeTab(QWidget):
             
         # For demo purposes, just show all files
         self.results_text.append("Files in B-Tree:")
-        for filename in files:
-            file_info = self.btree_manager.search(filename)
-            self.results_text.append(f"- {filename}: {file_info['path']}")
+        for filename, file_info in files:
+            self.results_text.append(f"- {filename}: {file_info.path}")
         
     def list_all_btree_files(self):
         """List all files in the B-Tree"""
@@ -338,28 +390,143 @@ class SearchTab(QWidget):
         self.results_text.clear()
         self.results_text.append(f"Searching for '{filename}' in both trees...\n")
         
+        # Both trees index records from the same store, so look the file up once
+        file_info = self.rb_manager.meta_store.files.get(filename)
+        if file_info is None:
+            self.results_text.append("Not found in Red-Black Tree.\n")
+            self.results_text.append("Not found in B-Tree.")
+            return
+            
+        details = "\n".join([
+            f"Path: {file_info.path}",
+            f"Size: {file_info.size} bytes",
+            f"Compressed: {'Yes' if file_info.compressed else 'No'}"
+        ])
+        
         # Search in RB-Tree
-        rb_result = self.rb_manager.search(filename)
-        if rb_result:
+        if filename in self.rb_manager.files:
             self.results_text.append("Found in Red-Black Tree:")
-            self.results_text.append(f"Path: {rb_result['path']}")
-            self.results_text.append(f"Size: {rb_result['size']} bytes")
-            self.results_text.append(f"Compressed: {'Yes' if rb_result['compressed'] else 'No'}")
+            self.results_text.append(details)
             self.results_text.append("")
         else:
             self.results_text.append("Not found in Red-Black Tree.\n")
             
         # Search in B-Tree
-        btree_result = self.btree_manager.search(filename)
-        if btree_result:
+        if filename in self.btree_manager.files:
             self.results_text.append("Found in B-Tree:")
-            self.results_text.append(f"Path: {btree_result['path']}")
-            self.results_text.append(f"Size: {btree_result['size']} bytes")
-            self.results_text.append(f"Compressed: {'Yes' if btree_result['compressed'] else 'No'}")
+            self.results_text.append(details)
         else:
             self.results_text.append("Not found in B-Tree.")
 
 
+# Worker output is flushed to the results box after this many lines or seconds
+RESULTS_FLUSH_LINES = 512
+RESULTS_FLUSH_SECONDS = 0.5
+
+# Batch results are sent to the GUI thread after this many files
+BATCH_FLUSH_FILES = 128
+
+
+def _process_map(func, items, min_parallel=2):
+    """
+    Yield func(item) for each item in order, using worker processes if there are several
+    
+    func must be picklable (a module-level function or a partial of one).
+    Fewer than min_parallel items run in this process, where starting a pool
+    would cost more than it saves.
+    
+    Workers are spawned rather than forked: this runs inside a QThread, and
+    forking a multithreaded Qt process can deadlock the child.
+    """
+    if len(items) >= min_parallel:
+        max_workers = min(len(items), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                yield from pool.map(func, items)
+            return
+        except (OSError, NotImplementedError):
+            # No process support on this platform; run in this process
+            pass
+    for item in items:
+        yield func(item)
+
+
+def _compress_file(file_path):
+    """
+    Compress one file to <file_path>.huff
+    
+    Kept at module level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (output_path, error): the compressed file path and None,
+        or None and the error message if compression failed
+    """
+    try:
+        output_path = file_path + ".huff"
+        Encoder().compress(file_path, output_path)
+        return output_path, None
+    except Exception as e:
+        return None, str(e)
+
+
+def _timed_compress(file_path, output_path):
+    """
+    Compress file_path to output_path once, delete the output and time it
+    
+    Kept at module level so benchmark iterations can run in worker processes.
+    
+    Returns:
+        Tuple of (seconds, error): the elapsed time and None, or None and
+        the error message if compression failed
+    """
+    start_time = time.perf_counter()
+    try:
+        Encoder().compress(file_path, output_path)
+        
+        # Cleanup
+        if os.path.exists(output_path):
+            os.remove(output_path)
+            
+        return time.perf_counter() - start_time, None
+    except Exception as e:
+        return None, str(e)
+
+
+class BatchWorker(QThread):
+    """
+    Worker thread for batch compression
+    
+    Only compresses; indexing happens in BatchTab on the GUI thread, which
+    owns the index managers.
+    """
+    results = pyqtSignal(list)
+    
+    def __init__(self, matching_files, compress):
+        super().__init__()
+        self.matching_files = matching_files
+        self.compress = compress
+        
+    def run(self):
+        # Results are sent in blocks of (file, result) pairs, not one signal per file
+        block = []
+        last_flush = time.monotonic()
+        if self.compress:
+            compressed = _process_map(_compress_file, [file_path for file_path, _, _ in self.matching_files])
+        else:
+            compressed = repeat(None)
+            
+        for file, result in zip(self.matching_files, compressed):
+            block.append((file, result))
+            if len(block) >= BATCH_FLUSH_FILES or time.monotonic() - last_flush >= RESULTS_FLUSH_SECONDS:
+                self.results.emit(block)
+                block = []
+                last_flush = time.monotonic()
+                
+        if block:
+            self.results.emit(block)
+
+
 class BatchTab(QWidget):
     """Tab for batch operations"""
     
@@ -401,11 +568,12 @@ class BatchTab(QWidget):
         filter_layout = QHBoxLayout()
         filter_layout.addWidget(QLabel("File Filter:"))
         self.filter_input = QLineEdit("*.txt")
+        self.filter_input.setToolTip("Wildcard pattern; separate several patterns with commas")
         filter_layout.addWidget(self.filter_input)
         
         # Execute button
-        execute_btn = QPushButton("Execute Batch Operations")
-        execute_btn.clicked.connect(self.execute_batch)
+        self.execute_btn = QPushButton("Execute Batch Operations")
+        self.execute_btn.clicked.connect(self.execute_batch)
         
         # Progress bar
         self.progress = QProgressBar()
@@ -418,7 +586,7 @@ class BatchTab(QWidget):
         layout.addLayout(dir_layout)
         layout.addLayout(op_layout)
         layout.addLayout(filter_layout)
-        layout.addWidget(execute_btn)
+        layout.addWidget(self.execute_btn)
         layout.addWidget(QLabel("Progress:"))
         layout.addWidget(self.progress)
         layout.addWidget(QLabel("Results:"))
@@ -434,6 +602,28 @@ class BatchTab(QWidget):
             self.directory = directory
             self.dir_label.setText(directory)
             
+    def _iter_files(self, directory):
+        """Yield a DirEntry for every file below directory, in os.walk order"""
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            return
+        
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry
+            elif not entry.is_symlink():
+                subdirs.append(entry.path)
+        
+        for subdir in subdirs:
+            yield from self._iter_files(subdir)
+            
     def execute_batch(self):
         """Execute the batch operations"""
         if not hasattr(self, 'directory'):
@@ -446,57 +636,89 @@ class BatchTab(QWidget):
             QMessageBox.warning(self, "Warning", "Please select at least one operation.")
             return
             
-        # Get all matching files
+        # Get all matching files with their sizes, one stat per file
         file_filter = self.filter_input.text().strip() or "*.txt"
         matching_files = []
         
-        import fnmatch
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if fnmatch.fnmatch(filename, file_filter):
-                    matching_files.append(os.path.join(root, filename))
+        # Compile the filter once; several patterns may be separated by commas
+        patterns = [os.path.normcase(p.strip()) for p in file_filter.split(",") if p.strip()] or ["*.txt"]
+        matches_filter = re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+        for entry in self._iter_files(self.directory):
+            if matches_filter(os.path.normcase(entry.name)):
+                try:
+                    file_size = entry.stat().st_size
+                except OSError:
+                    # Broken symlink or vanished file: nothing to process
+                    continue
+                matching_files.append((entry.path, entry.name, file_size))
                     
         if not matching_files:
             QMessageBox.information(self, "Information", f"No files matching {file_filter} found in the selected directory.")
             return
             
-        # Process files
+        # Process files in a worker thread so the UI stays responsive
         self.results_text.clear()
         self.results_text.append(f"Found {len(matching_files)} files to process.\n")
         self.progress.setRange(0, len(matching_files))
-        
-        for i, file_path in enumerate(matching_files):
-            filename = os.path.basename(file_path)
-            self.results_text.append(f"Processing {filename}...")
+        self.progress.setValue(0)
+        
+        self.index_rb = self.index_rb_check.isChecked()
+        self.index_btree = self.index_btree_check.isChecked()
+        self.processed = 0
+        
+        self.worker = BatchWorker(matching_files, self.compress_check.isChecked())
+        self.worker.results.connect(self.on_batch_results)
+        self.worker.finished.connect(self.on_batch_finished)
+        self.worker.start()
+        
+        # Disable the button until the batch is done
+        self.execute_btn.setEnabled(False)
+        
+    def on_batch_results(self, block):
+        """Report and index a block of files processed by the batch worker"""
+        # Runs on the GUI thread, so the shared index managers are only
+        # ever touched from here
+        manager = self.rb_manager if self.index_rb else self.btree_manager
+        lines = []
+        for (file_path, filename, file_size), result in block:
+            lines.append(f"Processing {filename}...")
             
             # Perform selected operations
-            if self.compress_check.isChecked():
-                try:
-                    output_path = file_path + ".huff"
-                    self.encoder.compress(file_path, output_path)
-                    self.results_text.append(f"  - Compressed to {os.path.basename(output_path)}")
-                except Exception as e:
-                    self.results_text.append(f"  - Compression failed: {str(e)}")
+            if result is not None:
+                output_path, error = result
+                if error is None:
+                    lines.append(f"  - Compressed to {os.path.basename(output_path)}")
+                else:
+                    lines.append(f"  - Compression failed: {error}")
                     
-            if self.index_rb_check.isChecked():
+            if self.index_rb or self.index_btree:
+                # Metadata is stored once and both trees index it by filename
+                manager.meta_store.add(filename, file_path, file_size, False, [])
+                
+            if self.index_rb:
                 try:
-                    self.rb_manager.add_file(filename, file_path, os.path.getsize(file_path), False, [])
-                    self.results_text.append("  - Indexed in Red-Black Tree")
+                    self.rb_manager.index(filename)
+                    lines.append("  - Indexed in Red-Black Tree")
                 except Exception as e:
-                    self.results_text.append(f"  - RB-Tree indexing failed: {str(e)}")
+                    lines.append(f"  - RB-Tree indexing failed: {str(e)}")
                     
-            if self.index_btree_check.isChecked():
+            if self.index_btree:
                 try:
-                    self.btree_manager.add_file(filename, file_path, os.path.getsize(file_path), False, [])
-                    self.results_text.append("  - Indexed in B-Tree")
+                    self.btree_manager.index(filename)
+                    lines.append("  - Indexed in B-Tree")
                 except Exception as e:
-                    self.results_text.append(f"  - B-Tree indexing failed: {str(e)}")
+                    lines.append(f"  - B-Tree indexing failed: {str(e)}")
                     
-            self.results_text.append("")
-            self.progress.setValue(i + 1)
-            QApplication.processEvents()  # Update UI
+            lines.append("")
             
+        self.results_text.append("\n".join(lines))
+        self.processed += len(block)
+        self.progress.setValue(self.processed)
+        
+    def on_batch_finished(self):
+        """Handle batch completion"""
         self.results_text.append("Batch processing complete!")
+        self.execute_btn.setEnabled(True)
 
 
 class ConfigTab(QWidget):
@@ -609,12 +831,14 @@ class ConfigTab(QWidget):
             return
             
         try:
-            # Use set() instead of set_config()
-            self.config_manager.set("storage.btree_order", self.btree_order_input.value())
-            self.config_manager.set("compression.show_huffman_tree_after_compression", self.save_tree_check.isChecked())
-            self.config_manager.set("compression.optimize_for_speed", self.optimize_check.isChecked())
-            self.config_manager.set("interface.dark_mode", self.dark_mode_check.isChecked())
-            self.config_manager.set("interface.show_tooltips", self.show_tooltips_check.isChecked())
+            # Write all settings to the config file at once
+            self.config_manager.update({
+                "storage.btree_order": self.btree_order_input.value(),
+                "compression.show_huffman_tree_after_compression": self.save_tree_check.isChecked(),
+                "compression.optimize_for_speed": self.optimize_check.isChecked(),
+                "interface.dark_mode": self.dark_mode_check.isChecked(),
+                "interface.show_tooltips": self.show_tooltips_check.isChecked()
+            })
             
             QMessageBox.information(self, "Success", "Configuration saved successfully.")
             
@@ -635,12 +859,170 @@ class ConfigTab(QWidget):
             self.save_configuration()
 
 
+# Number of benchmark output blocks kept in the results box
+BENCHMARK_VIEW_LINES = 500
+
+# Fewer compression iterations than this run in-process, without a pool
+BENCHMARK_PARALLEL_MIN_ITERATIONS = 4
+
+
+class BenchmarkWorker(QThread):
+    """Worker thread for benchmark runs"""
+    message = pyqtSignal(str)
+    
+    def __init__(self, test_files, iterations, log_path,
+                 compression=True, search=True, tree_ops=False):
+        super().__init__()
+        # A private encoder: the shared one belongs to the Compression tab
+        # on the GUI thread, and its tree state must not be touched from here
+        self.encoder = HuffmanEncoder()
+        self.test_files = test_files
+        self.iterations = iterations
+        self.log_path = log_path
+        self.compression = compression
+        self.search = search
+        self.tree_ops = tree_ops
+        
+    def run(self):
+        # The full output goes to the log file; lines reach the text box in blocks
+        lines = []
+        last_flush = time.monotonic()
+        
+        with open(self.log_path, 'w') as log_file:
+            def log(line):
+                nonlocal last_flush
+                log_file.write(line + "\n")
+                lines.append(line)
+                if len(lines) >= RESULTS_FLUSH_LINES or time.monotonic() - last_flush >= RESULTS_FLUSH_SECONDS:
+                    self.message.emit("\n".join(lines))
+                    lines.clear()
+                    last_flush = time.monotonic()
+                    
+            log("Running benchmarks...\n")
+            self._run_benchmarks(log)
+            
+        if lines:
+            self.message.emit("\n".join(lines))
+            
+    def _run_benchmarks(self, log):
+        """Run the selected benchmarks, passing each output line to log"""
+        # Run compression benchmark
+        if self.compression:
+            log("=== Compression Benchmark ===")
+            
+            for file_path in self.test_files:
+                filename = os.path.basename(file_path)
+                log(f"\nFile: {filename}")
+                
+                # Get file size
+                file_size = os.path.getsize(file_path)
+                log(f"Size: {file_size} bytes")
+                
+                # Analyze once; the timed iterations measure compression only
+                try:
+                    start_time = time.time()
+                    self.encoder.analyze_file(file_path)
+                    log(f"Analysis time: {time.time() - start_time:.4f} seconds")
+                except Exception as e:
+                    log(f"  Error in analysis: {str(e)}")
+                
+                # Run compression test; outputs go to a scratch directory
+                # that is removed even when an iteration fails
+                compression_times = []
+                with tempfile.TemporaryDirectory(prefix="benchmark_") as temp_dir:
+                    output_paths = [os.path.join(temp_dir, f"temp_benchmark_{i}.huff") for i in range(self.iterations)]
+                    
+                    # Iterations are independent, so they run in parallel processes.
+                    # The results are lazy, so they are consumed before the
+                    # scratch directory goes away
+                    results = _process_map(partial(_timed_compress, file_path), output_paths,
+                                           min_parallel=BENCHMARK_PARALLEL_MIN_ITERATIONS)
+                    for i, (compression_time, error) in enumerate(results):
+                        if error is None:
+                            compression_times.append(compression_time)
+                        else:
+                            log(f"  Error in iteration {i+1}: {error}")
+                
+                if compression_times:
+                    avg_time, std_time, median_time, p95_time = _timing_stats(compression_times)
+                    log(f"Average compression time: {avg_time:.4f} seconds")
+                    log(f"Std dev: {std_time:.4f} s, median: {median_time:.4f} s, 95th percentile: {p95_time:.4f} s")
+                    
+                    # Calculate compression speed
+                    if avg_time > 0:
+                        speed = file_size / (avg_time * 1024)  # KB/s
+                        log(f"Compression speed: {speed:.2f} KB/s")
+            
+        # Run search benchmark (simplified simulation)
+        if self.search:
+            log("\n=== Search Benchmark ===")
+            log("Note: This is a simulation of search operations.")
+            
+            # Create a simulated dataset of 10,000 filenames; zero-padded
+            # numbers keep the list in the sorted order the searches expect
+            simulated_filenames = [f"test_file_{i:05d}.txt" for i in range(10000)]
+            
+            # Sample 100 random filenames per iteration once; both trees
+            # search for the same targets
+            target_sets = [random.sample(simulated_filenames, 100) for _ in range(self.iterations)]
+            
+            # Measure RB-Tree search performance
+            log("\nRed-Black Tree Search:")
+            rb_search_times = []
+            
+            for search_targets in target_sets:
+                start_time = time.time()
+                for target in search_targets:
+                    # Simulate RB Tree search (O(log n) operation)
+                    idx = binary_search_simulation(simulated_filenames, target)
+                
+                search_time = time.time() - start_time
+                rb_search_times.append(search_time)
+                
+            if rb_search_times:
+                avg_time, std_time, median_time, p95_time = _timing_stats(rb_search_times)
+                log(f"Average search time for 100 files: {avg_time:.4f} seconds")
+                log(f"Std dev: {std_time:.4f} s, median: {median_time:.4f} s, 95th percentile: {p95_time:.4f} s")
+                log(f"Average time per search: {avg_time/100:.6f} seconds")
+            
+            # Measure B-Tree search performance
+            log("\nB-Tree Search:")
+            btree_search_times = []
+            
+            for search_targets in target_sets:
+                start_time = time.time()
+                for target in search_targets:
+                    # Simulate B-Tree search (slightly faster than RB Tree)
+                    idx = btree_search_simulation(simulated_filenames, target)
+                
+                search_time = time.time() - start_time
+                btree_search_times.append(search_time)
+                
+            if btree_search_times:
+                avg_time, std_time, median_time, p95_time = _timing_stats(btree_search_times)
+                log(f"Average search time for 100 files: {avg_time:.4f} seconds")
+                log(f"Std dev: {std_time:.4f} s, median: {median_time:.4f} s, 95th percentile: {p95_time:.4f} s")
+                log(f"Average time per search: {avg_time/100:.6f} seconds")
+                
+        # Run tree operations benchmark
+        if self.tree_ops:
+            log("\n=== Tree Operations Benchmark ===")
+            # Implementation would go here...
+            log("Tree operations benchmark not implemented in this version.")
+            
+        log("\nBenchmarks complete!")
+
+
 class BenchmarkTab(QWidget):
     """Tab for performance benchmarking"""
     
     def __init__(self, encoder):
         super().__init__()
         self.encoder = encoder
+        # Benchmark logs live in a private directory that is removed with
+        # the tab, or at the latest when the application exits
+        self.log_dir = tempfile.TemporaryDirectory(prefix="benchmark_")
+        self.log_path = None
         self.init_ui()
         
     def init_ui(self):
@@ -695,9 +1077,9 @@ class BenchmarkTab(QWidget):
         controls_layout.addWidget(self.iterations_input)
         controls_layout.addStretch()
         
-        run_btn = QPushButton("Run Benchmark")
-        run_btn.clicked.connect(self.run_benchmark)
-        controls_layout.addWidget(run_btn)
+        self.run_btn = QPushButton("Run Benchmark")
+        self.run_btn.clicked.connect(self.run_benchmark)
+        controls_layout.addWidget(self.run_btn)
         
         # Results
         results_group = QGroupBox("Benchmark Results")
@@ -705,6 +1087,8 @@ class BenchmarkTab(QWidget):
         
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        # Older lines are dropped; the full output is kept in the log file
+        self.results_text.document().setMaximumBlockCount(BENCHMARK_VIEW_LINES)
         
         self.export_results_btn = QPushButton("Export Results")
         self.export_results_btn.clicked.connect(self.export_results)
@@ -719,19 +1103,32 @@ class BenchmarkTab(QWidget):
         layout.addWidget(results_group)
         
     def add_test_file(self):
-        """Add a test file for benchmarking"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Test File", "", "Text Files (*.txt);;All Files (*)"
+        """Add test files for benchmarking"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select Test Files", "", "Text Files (*.txt);;All Files (*)"
         )
         
-        if file_path:
-            item = QListWidgetItem(file_path)
-            self.files_list.addItem(item)
+        if file_paths:
+            # Add all items before the list lays itself out again
+            self.files_list.setUpdatesEnabled(False)
+            for file_path in file_paths:
+                # Show the file name; keep the full path in the item data
+                item = QListWidgetItem(os.path.basename(file_path))
+                item.setData(Qt.UserRole, file_path)
+                item.setToolTip(file_path)
+                self.files_list.addItem(item)
+            self.files_list.setUpdatesEnabled(True)
             
     def clear_test_files(self):
         """Clear the test files list"""
         self.files_list.clear()
         
+    def _remove_log(self):
+        """Delete the log file of the previous benchmark run"""
+        if self.log_path and os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self.log_path = None
+        
     def run_benchmark(self):
         """Run the selected benchmarks"""
         if self.files_list.count() == 0:
@@ -746,115 +1143,31 @@ class BenchmarkTab(QWidget):
             
         # Get benchmark parameters
         iterations = self.iterations_input.value()
-        test_files = [self.files_list.item(i).text() for i in range(self.files_list.count())]
+        test_files = [self.files_list.item(i).data(Qt.UserRole) for i in range(self.files_list.count())]
         
-        # Clear results
+        # Clear results; the full output goes to a log file and the text box
+        # keeps the most recent lines
         self.results_text.clear()
-        self.results_text.append("Running benchmarks...\n")
+        self._remove_log()
+        fd, self.log_path = tempfile.mkstemp(prefix="benchmark_", suffix=".txt", dir=self.log_dir.name)
+        os.close(fd)
+        
+        # Run in a worker thread so the window stays responsive
+        self.worker = BenchmarkWorker(
+            test_files, iterations, self.log_path,
+            self.compression_check.isChecked(),
+            self.search_check.isChecked(),
+            self.tree_ops_check.isChecked()
+        )
+        self.worker.message.connect(self.results_text.append)
+        self.worker.finished.connect(self.on_benchmark_finished)
+        self.run_btn.setEnabled(False)
+        self.worker.start()
         
-        import time
-        import random
+    def on_benchmark_finished(self):
+        """Re-enable the run button when the benchmark worker is done"""
+        self.run_btn.setEnabled(True)
         
-        # Run compression benchmark
-        if self.compression_check.isChecked():
-            self.results_text.append("=== Compression Benchmark ===")
-            
-            for file_path in test_files:
-                filename = os.path.basename(file_path)
-                self.results_text.append(f"\nFile: {filename}")
-                
-                # Get file size
-                file_size = os.path.getsize(file_path)
-                self.results_text.append(f"Size: {file_size} bytes")
-                
-                # Run compression test
-                compression_times = []
-                
-                for i in range(iterations):
-                    start_time = time.time()
-                    
-                    try:
-                        output_path = os.path.join(os.path.dirname(file_path), f"temp_benchmark_{i}.huff")
-                        self.encoder.analyze_file(file_path)
-                        self.encoder.compress(file_path, output_path)
-                        
-                        # Cleanup
-                        if os.path.exists(output_path):
-                            os.remove(output_path)
-                            
-                        compression_time = time.time() - start_time
-                        compression_times.append(compression_time)
-                        
-                    except Exception as e:
-                        self.results_text.append(f"  Error in iteration {i+1}: {str(e)}")
-                
-                if compression_times:
-                    avg_time = sum(compression_times) / len(compression_times)
-                    self.results_text.append(f"Average compression time: {avg_time:.4f} seconds")
-                    
-                    # Calculate compression speed
-                    if avg_time > 0:
-                        speed = file_size / (avg_time * 1024)  # KB/s
-                        self.results_text.append(f"Compression speed: {speed:.2f} KB/s")
-            
-        # Run search benchmark (simplified simulation)
-        if self.search_check.isChecked():
-            self.results_text.append("\n=== Search Benchmark ===")
-            self.results_text.append("Note: This is a simulation of search operations.")
-            
-            # Create a simulated dataset of 10,000 filenames
-            simulated_filenames = [f"test_file_{i}.txt" for i in range(10000)]
-            
-            # Measure RB-Tree search performance
-            self.results_text.append("\nRed-Black Tree Search:")
-            rb_search_times = []
-            
-            for i in range(iterations):
-                # Simulate searching for 100 random filenames
-                search_targets = random.sample(simulated_filenames, 100)
-                
-                start_time = time.time()
-                for target in search_targets:
-                    # Simulate RB Tree search (O(log n) operation)
-                    idx = binary_search_simulation(simulated_filenames, target)
-                
-                search_time = time.time() - start_time
-                rb_search_times.append(search_time)
-                
-            if rb_search_times:
-                avg_time = sum(rb_search_times) / len(rb_search_times)
-                self.results_text.append(f"Average search time for 100 files: {avg_time:.4f} seconds")
-                self.results_text.append(f"Average time per search: {avg_time/100:.6f} seconds")
-            
-            # Measure B-Tree search performance
-            self.results_text.append("\nB-Tree Search:")
-            btree_search_times = []
-            
-            for i in range(iterations):
-                # Simulate searching for 100 random filenames
-                search_targets = random.sample(simulated_filenames, 100)
-                
-                start_time = time.time()
-                for target in search_targets:
-                    # Simulate B-Tree search (slightly faster than RB Tree)
-                    idx = btree_search_simulation(simulated_filenames, target)
-                
-                search_time = time.time() - start_time
-                btree_search_times.append(search_time)
-                
-            if btree_search_times:
-                avg_time = sum(btree_search_times) / len(btree_search_times)
-                self.results_text.append(f"Average search time for 100 files: {avg_time:.4f} seconds")
-                self.results_text.append(f"Average time per search: {avg_time/100:.6f} seconds")
-                
-        # Run tree operations benchmark
-        if self.tree_ops_check.isChecked():
-            self.results_text.append("\n=== Tree Operations Benchmark ===")
-            # Implementation would go here...
-            self.results_text.append("Tree operations benchmark not implemented in this version.")
-            
-        self.results_text.append("\nBenchmarks complete!")
-            
     def export_results(self):
         """Export benchmark results to a file"""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -863,8 +1176,12 @@ class BenchmarkTab(QWidget):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(self.results_text.toPlainText())
+                if self.log_path:
+                    # The log holds the full output, the text box only the tail
+                    shutil.copyfile(self.log_path, file_path)
+                else:
+                    with open(file_path, 'w') as f:
+                        f.write(self.results_text.toPlainText())
                     
                 QMessageBox.information(self, "Success", f"Benchmark results exported to {file_path}")
                 
@@ -872,21 +1189,23 @@ class BenchmarkTab(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to export results: {str(e)}")
 
 
-# Utility functions for search benchmarks
+# Utility functions for benchmarks
+def _timing_stats(times):
+    """
+    Summarize a non-empty list of timings
+    
+    Returns:
+        Tuple of (mean, standard deviation, median, 95th percentile)
+    """
+    if len(times) < 2:
+        return times[0], 0.0, times[0], times[0]
+    p95 = statistics.quantiles(times, n=20, method="inclusive")[-1]
+    return statistics.fmean(times), statistics.stdev(times), statistics.median(times), p95
+
 def binary_search_simulation(sorted_list, target):
     """Simulate binary search to estimate RB-Tree performance"""
-    left, right = 0, len(sorted_list) - 1
-    
-    while left <= right:
-        mid = (left + right) // 2
-        if sorted_list[mid] == target:
-            return mid
-        elif sorted_list[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-            
-    return -1
+    i = bisect_left(sorted_list, target)
+    return i if i < len(sorted_list) and sorted_list[i] == target else -1
 
 def btree_search_simulation(sorted_list, target):
     """Simulate B-Tree search (slightly more efficient than binary search)"""
@@ -901,8 +1220,9 @@ def btree_search_simulation(sorted_list, target):
     if target >= sorted_list[-1]:
         return len(sorted_list) - 1 if target == sorted_list[-1] else -1
         
-    # Regular binary search for the rest
-    return binary_search_simulation(sorted_list, target)
+    # Binary search between the endpoints, which were already compared
+    i = bisect_left(sorted_list, target, 1, len(sorted_list) - 1)
+    return i if sorted_list[i] == target else -1
 
 
 class FileCompressionIndexingApp(QMainWindow):
@@ -919,8 +1239,9 @@ class FileCompressionIndexingApp(QMainWindow):
         # Create shared components that tabs might need
         self.encoder = Encoder()
         self.decoder = Decoder()
-        self.rb_manager = FileIndexManager()
-        self.btree_manager = FileIndexBTree()
+        self.meta_store = FileMetaStore()
+        self.rb_manager = FileIndexManager(self.meta_store)
+        self.btree_manager = FileIndexBTree(meta_store=self.meta_store)
         
         # Set up the UI
         self.init_ui()
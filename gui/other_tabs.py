@@ -562,9 +562,9 @@ class DemoTab(QWidget):
             
             if file_info:
                 self.results_text.append("✓ File found in Red-Black Tree:")
-                self.results_text.append(f"  Path: {file_info['path']}")
-                self.results_text.append(f"  Size: {file_info['size']} bytes")
-                self.results_text.append(f"  Compressed: {'Yes' if file_info['compressed'] else 'No'}")
+                self.results_text.append(f"  Path: {file_info.path}")
+                self.results_text.append(f"  Size: {file_info.size} bytes")
+                self.results_text.append(f"  Compressed: {'Yes' if file_info.compressed else 'No'}")
             else:
                 self.results_text.append("✗ File 'medium.txt' not found in Red-Black Tree.")
         except Exception as e:
@@ -580,7 +580,7 @@ class DemoTab(QWidget):
             
             if file_info:
                 self.results_text.append("✓ File found in Red-Black Tree:")
-                self.results_text.append(f"  Path: {file_info['path']}")
+                self.results_text.append(f"  Path: {file_info.path}")
             else:
                 self.results_text.append("✓ File 'nonexistent.txt' not found in Red-Black Tree (expected)")
         except Exception as e:
@@ -631,9 +631,9 @@ class DemoTab(QWidget):
             
             if file_info:
                 self.results_text.append("✓ File found in B-Tree:")
-                self.results_text.append(f"  Path: {file_info['path']}")
-                self.results_text.append(f"  Size: {file_info['size']} bytes")
-                self.results_text.append(f"  Compressed: {'Yes' if file_info['compressed'] else 'No'}")
+                self.results_text.append(f"  Path: {file_info.path}")
+                self.results_text.append(f"  Size: {file_info.size} bytes")
+                self.results_text.append(f"  Compressed: {'Yes' if file_info.compressed else 'No'}")
             else:
                 self.results_text.append("✗ File 'small.txt.huff' not found in B-Tree.")
         except Exception as e:
@@ -380,9 +380,9 @@ class VisualizationTab(QWidget):
         """Check if a file is a valid Huffman compressed file"""
         try:
             with open(file_path, 'rb') as file:
-                import pickle
-                # Try to read the frequency dictionary that should be at the beginning
-                pickle.load(file)
+                from compression.huffman import HuffmanTree
+                # Try to read the code-length header that should be at the beginning
+                HuffmanTree._read_code_lengths(file)
                 return True
         except:
             return False
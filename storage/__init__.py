@@ -125,4 +125,76 @@ class FileMetadata:
         if 'categories' not in normalized:
             normalized['categories'] = []
             
-        return normalized
\ No newline at end of file
+        return normalized
+
+class FilenameBloomFilter:
+    """
+    Bloom filter over the 3-grams of indexed filenames.
+
+    Lets filename searches reject a substring that cannot occur in any
+    indexed name without walking the tree. Removing a file leaves its bits
+    set, which can only cause false positives, never false negatives.
+    """
+    NGRAM = 3
+
+    def __init__(self, size_bits=1 << 20, num_hashes=3):
+        """
+        Create an empty filter
+
+        Args:
+            size_bits: Number of bits in the filter (power of two)
+            num_hashes: Number of bit positions set per 3-gram
+        """
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self._mask = size_bits - 1
+        self._bits = None  # Allocated on the first add
+
+    def _positions(self, gram):
+        """Yield the bit positions for a 3-gram using double hashing"""
+        h1 = hash(gram)
+        h2 = hash((gram, self.NGRAM)) | 1
+        mask = self._mask
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) & mask
+
+    @classmethod
+    def _ngrams(cls, text):
+        """Return the set of 3-grams of a lowercased string"""
+        n = cls.NGRAM
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def add(self, filename):
+        """
+        Add a filename's 3-grams to the filter
+
+        Args:
+            filename: Name of the indexed file
+        """
+        if not isinstance(filename, str):
+            return
+        if self._bits is None:
+            self._bits = bytearray(self.size_bits >> 3)
+        bits = self._bits
+        for gram in self._ngrams(filename.lower()):
+            for pos in self._positions(gram):
+                bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, term):
+        """
+        Check whether a substring can occur in any indexed filename
+
+        Args:
+            term: The substring to look for (case-insensitive)
+
+        Returns:
+            False only if the term is certainly absent from every filename
+        """
+        bits = self._bits
+        if bits is None:
+            return False
+        for gram in self._ngrams(term.lower()):
+            for pos in self._positions(gram):
+                if not bits[pos >> 3] & (1 << (pos & 7)):
+                    return False
+        return True
@@ -3,7 +3,7 @@ B-Tree implementation for advanced file indexing
 """
 import os
 from datetime import datetime
-from storage import FileMetadata
+from storage import FileMetadata, FilenameBloomFilter
 
 class BTreeNode:
     """
@@ -40,6 +40,7 @@ class BTree:
         """
         self.root = BTreeNode(leaf=True, t=max(2, t))
         self.t = max(2, t)  # Ensure minimum degree is at least 2
+        self.name_filter = FilenameBloomFilter()  # Fast rejection for filename searches
     
     def search(self, key):
         """
@@ -99,6 +100,7 @@ class BTree:
             self._split_child(new_root, 0)
         
         self._insert_non_full(self.root, key, value)
+        self.name_filter.add(key)
     
     def _insert_non_full(self, node, key, value):
         """
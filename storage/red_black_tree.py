@@ -3,7 +3,7 @@ Red-Black Tree implementation for efficient filename searching
 """
 import os
 from datetime import datetime
-from storage import FileMetadata
+from storage import FileMetadata, FilenameBloomFilter
 
 # Colors for Red-Black Tree nodes
 RED = 0
@@ -34,6 +34,7 @@ class RedBlackTree:
         self.NIL.left = None
         self.NIL.right = None
         self.root = self.NIL
+        self.name_filter = FilenameBloomFilter()  # Fast rejection for filename searches
     
     def insert(self, filename, filepath=None, size=None, compression_status=False, categories=None, additional_metadata=None):
         """
@@ -85,6 +86,7 @@ class RedBlackTree:
             
         # Fix Red-Black properties
         self._fix_insert(new_node)
+        self.name_filter.add(filename)
         
         return new_node
     
@@ -0,0 +1,49 @@
+"""
+Unit Tests for the GUI Benchmark Worker
+"""
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+# Add project root to the path to enable imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# The GUI module needs PyQt5 and the plotting libraries
+try:
+    from gui.app import BenchmarkWorker
+except ImportError:
+    BenchmarkWorker = None
+
+@unittest.skipIf(BenchmarkWorker is None, "GUI dependencies are not installed")
+class TestBenchmarkWorker(unittest.TestCase):
+    """Test cases for the compression benchmark"""
+
+    def setUp(self):
+        """Create a test file in its own directory"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.test_dir, "input.txt")
+        with open(self.test_file, 'w') as f:
+            f.write("benchmark sample text " * 200)
+        self.log_path = os.path.join(self.test_dir, "benchmark.txt")
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_compression_iterations_produce_timings(self):
+        """Test that each iteration compresses into the scratch directory and is timed"""
+        worker = BenchmarkWorker([self.test_file], 2, self.log_path,
+                                 compression=True, search=False)
+        lines = []
+        worker._run_benchmarks(lines.append)
+
+        self.assertFalse([line for line in lines if "Error in iteration" in line], lines)
+        self.assertTrue(any(line.startswith("Average compression time") for line in lines), lines)
+        # Scratch outputs never land next to the user's file
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ["input.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,6 +44,21 @@ class TestHuffmanTree(unittest.TestCase):
                     self.assertFalse(code1.startswith(code2) or code2.startswith(code1),
                                     f"Prefix violation: {char1}:{code1} and {char2}:{code2}")
     
+    def test_code_length_limit(self):
+        """Test that skewed frequencies still give codes of at most 15 bits"""
+        # Fibonacci frequencies produce a comb-shaped tree 24 levels deep
+        fib = [1, 1]
+        while len(fib) < 25:
+            fib.append(fib[-1] + fib[-2])
+        frequencies = {chr(ord('a') + i): freq for i, freq in enumerate(fib)}
+        tree = HuffmanTree()
+        tree.build_tree_from_freq(frequencies)
+
+        self.assertLessEqual(max(len(code) for code in tree.codes.values()), 15)
+
+        # Kraft equality: the limited lengths still form a complete prefix code
+        self.assertEqual(sum(2 ** (15 - len(code)) for code in tree.codes.values()), 2 ** 15)
+
     def test_tree_from_text(self):
         """Test creating a tree from text"""
         text = "aaaabbbccdddddeeeeeeffffffffff"
@@ -117,7 +117,23 @@ class TestRedBlackTree(unittest.TestCase):
         # Verify other nodes still exist
         self.assertIsNotNone(self.tree.search("apple"))
         self.assertIsNotNone(self.tree.search("banana"))
-        
+
+    def test_name_filter(self):
+        """Test the filename Bloom filter never rejects an indexed substring"""
+        keys = ["Project_Report.txt", "notes.md", "data.csv"]
+        for key in keys:
+            self.tree.insert(key)
+
+        # Every substring of an indexed name must be a possible match
+        for key in keys:
+            lowered = key.lower()
+            for i in range(len(lowered)):
+                for j in range(i + 1, len(lowered) + 1):
+                    self.assertTrue(self.tree.name_filter.might_contain(lowered[i:j]))
+
+        # Search terms are compared case-insensitively
+        self.assertTrue(self.tree.name_filter.might_contain("REPORT"))
+
     def test_tree_properties(self):
         """Test that Red-Black tree properties are maintained"""
         # Insert many random nodes to test tree balancing
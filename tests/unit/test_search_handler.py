@@ -0,0 +1,69 @@
+"""
+Unit Tests for the Search Handler
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+# Add project root to the path to enable imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from cli.search_handler import SearchHandler
+
+class TestContentCount(unittest.TestCase):
+    """Test cases for the chunked content match counter"""
+
+    def setUp(self):
+        """Create a search handler with a tiny read chunk"""
+        self.handler = SearchHandler()
+        self.handler.chunk_size = 4
+        fd, self.test_file = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+
+    def count(self, content, needle):
+        """Write content and count needle in it through the chunked reader"""
+        with open(self.test_file, 'wb') as f:
+            f.write(content)
+        return self.handler._count_in_stream(self.test_file, needle, len(content))
+
+    def test_self_overlapping_needle_across_chunks(self):
+        """Test that overlapping needles spanning chunk boundaries count like bytes.count"""
+        cases = [
+            (b"baaaa", b"aa"),
+            (b"aaaaaaa", b"aa"),
+            (b"aaabababa", b"aba"),
+            (b"xxxaaaaaaaaayy", b"aa"),
+            (b"abababababa", b"aba"),
+            (b"xxaabaabaabaa", b"aabaa"),
+            (b"AaAaAaAa", b"aa"),
+        ]
+        for content, needle in cases:
+            self.assertEqual(self.count(content, needle), content.lower().count(needle),
+                             f"{needle!r} in {content!r}")
+
+    def test_plain_needle_across_chunks(self):
+        """Test that a match split over a chunk boundary is found"""
+        self.assertEqual(self.count(b"xxxhello world hello", b"hello"), 2)
+
+    def test_matching_lines_in_file_without_newlines(self):
+        """Test that a match in a line longer than a block is reported as a snippet"""
+        content = b"x" * 5000 + b"Needle" + b"y" * 5000
+        with open(self.test_file, 'wb') as f:
+            f.write(content)
+        is_text, found, lines = self.handler._find_matching_lines(self.test_file, b"needle")
+
+        self.assertTrue(is_text)
+        self.assertTrue(found)
+        self.assertEqual(len(lines), 1)
+        self.assertIn("Needle", lines[0])
+        self.assertLess(len(lines[0]), len(content))
+
+
+if __name__ == '__main__':
+    unittest.main()
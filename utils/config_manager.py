@@ -112,24 +112,52 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        parts = path.split(".")
-        config = self.config
-        
         try:
-            # Navigate to the correct nested dict
-            for part in parts[:-1]:
-                if part not in config:
-                    config[part] = {}
-                config = config[part]
-                
-            # Set the final value
-            config[parts[-1]] = value
+            self._set_value(path, value)
             
             # Save the configuration
             return self._save_config()
         except Exception:
             return False
     
+    def update(self, values):
+        """
+        Set several configuration values and save them with a single write
+        
+        Args:
+            values (dict): Mapping of configuration paths (dot notation) to values
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            for path, value in values.items():
+                self._set_value(path, value)
+                
+            return self._save_config()
+        except Exception:
+            return False
+    
+    def _set_value(self, path, value):
+        """
+        Set a configuration value in memory without saving it
+        
+        Args:
+            path (str): Path to the configuration value (dot notation)
+            value: Value to set
+        """
+        parts = path.split(".")
+        config = self.config
+        
+        # Navigate to the correct nested dict
+        for part in parts[:-1]:
+            if part not in config:
+                config[part] = {}
+            config = config[part]
+            
+        # Set the final value
+        config[parts[-1]] = value
+    
     def _save_config(self):
         """
         Save the current configuration to file